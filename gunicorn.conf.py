@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for PiBot Master Hub
+
+Usage:
+    gunicorn -c gunicorn.conf.py master_hub:app
+
+The gevent worker calls monkey.patch_all() itself before the app is imported,
+so master_hub does not need to patch anything when run under gunicorn.
+"""
+
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"
+
+# Cooperative worker: idle keep-alive / SSE connections cost a greenlet, not a
+# whole worker.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+# MemoryManager and the skill caches live in process memory, so a single worker
+# keeps every request on the same tape. Raise only once state is shared.
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+
+# LLM round-trips can exceed gunicorn's 30s default.
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+keepalive = 5
+
+accesslog = None
+errorlog = "-"
+loglevel = "info"
@@ -4,16 +4,23 @@ PiBot V3 - Master Hub (Robust Edition)
 """
 
 import os
+import re
 import json
+import gzip
+import hashlib
 import time
 import subprocess
 import threading
 import logging
 import socket
 import sys
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
 from functools import wraps
+from itertools import islice
+from uuid import UUID
 
 # ============================================================================
 # 1. 日志配置（最先初始化）
@@ -70,6 +77,51 @@ except ImportError as e:
     NEW_COMPONENTS_AVAILABLE = False
     logger.warning(f"New components not available: {e}")
 
+try:
+    import orjson
+
+    # datetime/UUID are serialized natively by orjson. Naive datetimes in this
+    # codebase are local time, so OPT_NAIVE_UTC is intentionally not set.
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+    ORJSON_OPTIONS = 0
+    logger.info("orjson not available, falling back to stdlib json")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def json_default(obj):
+    """Serialize types that the JSON encoder does not handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, Path, UUID)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_text(obj):
+    """Serialize obj to a JSON str, keeping non-ASCII characters unescaped."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS).decode(
+            "utf-8"
+        )
+    return json.dumps(obj, ensure_ascii=False, default=json_default)
+
+
+def dumps_bytes(obj):
+    """Serialize obj to UTF-8 JSON bytes, ready to be sent as a response body."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS)
+    return dumps_text(obj).encode("utf-8")
+
+
+# Parse a JSON str/bytes; orjson's JSONDecodeError subclasses json's.
+loads_json = orjson.loads if orjson is not None else json.loads
+
 
 # ============================================================================
 # 2. 配置管理（带验证）
@@ -98,11 +150,14 @@ class Config:
     HOST = os.environ.get("HOST", "0.0.0.0")
     PORT = int(os.environ.get("PORT", "5000"))
     DEBUG = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
+    SSE_KEEPALIVE_SECONDS = int(os.environ.get("SSE_KEEPALIVE_SECONDS", "25"))
 
     # Memory Configuration
     TAPE_FILE = Path("memory.jsonl")
     MAX_TAPE_SIZE_MB = int(os.environ.get("MAX_TAPE_SIZE_MB", "100"))
     MAX_HISTORY_ENTRIES = int(os.environ.get("MAX_HISTORY_ENTRIES", "50"))
+    # 多步技能调用时，每次发送给 LLM 的最近对话轮数（system prompt 之外）
+    SKILL_CONTEXT_WINDOW = int(os.environ.get("SKILL_CONTEXT_WINDOW", "3"))
 
     @classmethod
     def validate(cls):
@@ -202,9 +257,11 @@ class MemoryManager:
 
     Optimizations:
     1. Offset caching: Track read position to avoid re-reading entire file
-    2. Memory cache: Keep parsed entries in memory for fast access
+    2. Memory cache: Keep the last cache_size entries in a bounded deque,
+       loaded at startup from the tail of the file only
     3. Incremental reads: Only read new lines since last read
     4. Batch operations: Support batch append for better performance
+    5. Long-lived append handle: one write+flush per entry, no open/close
     """
 
     def __init__(self, tape_file: Path, max_size_mb: int = 100, cache_size: int = 1000):
@@ -212,10 +269,17 @@ class MemoryManager:
         self.max_size_mb = max_size_mb
         self.cache_size = cache_size
         self._lock = threading.Lock()
+        # Notified on every append; _version counts appends for waiters
+        self._appended = threading.Condition(self._lock)
+        self._version = 0
 
         # Performance optimizations
         self._read_offset = 0  # File position for incremental reads
-        self._entry_cache: list = []  # In-memory cache
+        self._tape_fh = None  # Append handle, see _tape_handle()
+        self._last_id = 0  # Id of the newest entry, see append()
+        self._line_count = (None, 0, 0)  # (inode, offset, lines) for get_stats
+        self._tape_ino = None
+        self._entry_cache = deque(maxlen=cache_size)  # In-memory cache
         self._cache_hits = 0
         self._cache_misses = 0
 
@@ -223,34 +287,50 @@ class MemoryManager:
         self._init_cache()
 
     def _init_cache(self):
-        """Initialize cache from existing file."""
+        """Initialize cache from the tail of the existing file."""
         if not self.tape_file.exists():
             return
 
         try:
             with self._lock:
-                with open(self.tape_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                            if entry.get("content") is not None:
-                                self._entry_cache.append(entry)
-                        except json.JSONDecodeError:
-                            continue
-                    self._read_offset = f.tell()
-
-            # Trim cache if too large
-            if len(self._entry_cache) > self.cache_size:
-                self._entry_cache = self._entry_cache[-self.cache_size :]
+                with open(self.tape_file, "rb") as f:
+                    end = start = f.seek(0, 2)
+                    # Read backwards until the tail holds cache_size lines
+                    chunks, newlines = [], 0
+                    while start > 0 and newlines <= self.cache_size:
+                        step = min(65536, start)
+                        start -= step
+                        f.seek(start)
+                        chunks.append(f.read(step))
+                        newlines += chunks[-1].count(b"\n")
+                lines = b"".join(reversed(chunks)).splitlines()
+                if start > 0:
+                    lines = lines[1:]  # Partial line at the seek point
+
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = loads_json(line)
+                        if entry.get("content") is not None:
+                            self._entry_cache.append(entry)
+                    except json.JSONDecodeError:
+                        continue
+                self._read_offset = end
+                if self._entry_cache:
+                    self._last_id = self._entry_cache[-1].get("id", 0)
 
             logger.info(f"Memory cache initialized: {len(self._entry_cache)} entries")
 
         except Exception as e:
             logger.error(f"Failed to initialize cache: {e}")
 
+    def _cached_tail(self, limit: int) -> list:
+        """Last `limit` cached entries, oldest first."""
+        skip = max(len(self._entry_cache) - limit, 0)
+        return list(islice(self._entry_cache, skip, None))
+
     @safe_operation(default_return=None)
     def append(self, role: str, content, meta=None):
         """Append entry to tape with error handling."""
@@ -258,32 +338,34 @@ class MemoryManager:
             logger.warning(f"Skipping empty content for role: {role}")
             return None
 
-        entry = {
-            "id": int(time.time() * 1000),
-            "ts": datetime.now().isoformat(),
-            "role": role,
-            "content": content,
-            "meta": meta or {},
-        }
-
         with self._lock:
+            # Millisecond ids, bumped past the last one so that appends within
+            # the same millisecond still get unique, increasing ids
+            now_ns = time.time_ns()
+            self._last_id = max(now_ns // 1_000_000, self._last_id + 1)
+            entry = {
+                "id": self._last_id,
+                "ts": datetime.fromtimestamp(now_ns / 1e9).isoformat(),
+                "role": role,
+                "content": content,
+                "meta": meta or {},
+            }
+
             try:
                 # Check file rotation first
                 self._rotate_if_needed()
 
-                # Write to file
-                with open(self.tape_file, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                # Write to file; the append position is the new read offset.
+                # Flushed right away so readers and mtime watchers see it.
+                f = self._tape_handle()
+                f.write(dumps_text(entry) + "\n")
+                f.flush()
+                self._read_offset = f.tell()
 
-                # Update cache and offset
+                # Update cache (the deque drops the oldest entry)
                 self._entry_cache.append(entry)
-                if len(self._entry_cache) > self.cache_size:
-                    self._entry_cache.pop(0)  # Remove oldest
-
-                # Update read offset to end of file
-                with open(self.tape_file, "r", encoding="utf-8") as f:
-                    f.seek(0, 2)  # Seek to end
-                    self._read_offset = f.tell()
+                self._version += 1
+                self._appended.notify_all()
 
                 logger.debug(
                     f"Appended to tape: {role}, cache size: {len(self._entry_cache)}"
@@ -305,7 +387,7 @@ class MemoryManager:
                 # Try to read from cache first if limit is small
                 if limit <= len(self._entry_cache):
                     self._cache_hits += 1
-                    return self._entry_cache[-limit:]
+                    return self._cached_tail(limit)
 
                 # Check if file has been modified (truncated or replaced)
                 current_size = self.tape_file.stat().st_size
@@ -313,7 +395,7 @@ class MemoryManager:
                     # File was truncated, reset cache
                     logger.warning("Tape file was truncated, resetting cache")
                     self._read_offset = 0
-                    self._entry_cache = []
+                    self._entry_cache.clear()
 
                 # Read only new lines since last read
                 new_entries = []
@@ -324,7 +406,7 @@ class MemoryManager:
                         if not line:
                             continue
                         try:
-                            entry = json.loads(line)
+                            entry = loads_json(line)
                             if entry.get("content") is not None:
                                 new_entries.append(entry)
                                 self._entry_cache.append(entry)
@@ -333,33 +415,56 @@ class MemoryManager:
                             continue
                     self._read_offset = f.tell()
 
-                # Trim cache if too large
-                if len(self._entry_cache) > self.cache_size:
-                    excess = len(self._entry_cache) - self.cache_size
-                    self._entry_cache = self._entry_cache[excess:]
-
                 self._cache_misses += 1
 
                 # Return from cache
-                return self._entry_cache[-limit:]
+                return self._cached_tail(limit)
 
         except Exception as e:
             logger.error(f"Failed to read tape: {e}")
             return []
 
+    @property
+    def version(self) -> int:
+        """Number of entries appended by this process so far."""
+        return self._version
+
+    def wait_for_append(self, version: int, timeout: float) -> int:
+        """Block until an entry is appended after `version` or timeout expires.
+
+        Returns the current version (equal to `version` on timeout).
+        """
+        with self._appended:
+            self._appended.wait_for(lambda: self._version != version, timeout)
+            return self._version
+
     def read_all(self) -> list:
         """Read all entries (for full history export)."""
-        return self._entry_cache.copy()
+        return list(self._entry_cache)
 
     def clear_cache(self):
         """Clear memory cache (useful for testing)."""
         with self._lock:
-            self._entry_cache = []
+            self._entry_cache.clear()
             self._read_offset = 0
             self._cache_hits = 0
             self._cache_misses = 0
         logger.info("Memory cache cleared")
 
+    def _tape_handle(self):
+        """Return the append handle, reopening it if the tape was replaced."""
+        try:
+            ino = self.tape_file.stat().st_ino
+        except FileNotFoundError:
+            ino = None
+        if self._tape_fh is not None and ino != self._tape_ino:
+            self._tape_fh.close()
+            self._tape_fh = None
+        if self._tape_fh is None:
+            self._tape_fh = open(self.tape_file, "a", encoding="utf-8")
+            self._tape_ino = os.fstat(self._tape_fh.fileno()).st_ino
+        return self._tape_fh
+
     def _rotate_if_needed(self):
         """Rotate tape file if too large."""
         if not self.tape_file.exists():
@@ -373,10 +478,24 @@ class MemoryManager:
             )
             self.tape_file.rename(backup)
             # Reset cache for new file
-            self._entry_cache = []
+            self._entry_cache.clear()
             self._read_offset = 0
             self.tape_file.write_text("")
 
+    def _count_lines(self) -> int:
+        """Count tape lines, scanning only the bytes added since the last count."""
+        ino, offset, lines = self._line_count
+        with open(self.tape_file, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != ino or st.st_size < offset:
+                # Rotated, replaced or truncated: count from the start
+                offset, lines = 0, 0
+            f.seek(offset)
+            for block in iter(lambda: f.read(1 << 16), b""):
+                lines += block.count(b"\n")
+            self._line_count = (st.st_ino, f.tell(), lines)
+        return lines
+
     def get_stats(self):
         """Get tape statistics including cache performance."""
         if not self.tape_file.exists():
@@ -391,8 +510,7 @@ class MemoryManager:
 
         try:
             size_mb = self.tape_file.stat().st_size / (1024 * 1024)
-            with open(self.tape_file, "r", encoding="utf-8") as f:
-                lines = sum(1 for _ in f)
+            lines = self._count_lines()
 
             hit_rate = self._cache_hits / max(self._cache_hits + self._cache_misses, 1)
 
@@ -470,6 +588,22 @@ class LLMClient:
         logger.error(f"LLM failed after {max_retries + 1} attempts: {last_error}")
         return None
 
+    def chat_stream(self, messages, model=None):
+        """Yield reply text deltas as the LLM produces them.
+
+        No retries: a half-consumed stream cannot be replayed, so failures
+        propagate and the caller decides how to recover.
+        """
+        if not self.client:
+            raise RuntimeError("LLM client not available")
+
+        stream = self.client.chat.completions.create(
+            model=model or Config.MODEL_NAME, messages=messages, stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
 
 llm = LLMClient()
 
@@ -478,6 +612,118 @@ llm = LLMClient()
 # ============================================================================
 
 
+# First <call_skill>...</call_skill> request in an LLM reply
+CALL_SKILL_RE = re.compile(r"<call_skill>(.*?)</call_skill>", re.DOTALL)
+
+
+def window_messages(messages, window):
+    """Keep the system prompt plus the last `window` exchanges.
+
+    The trailing message (latest skill result) is always included.
+    """
+    keep = 2 * window + 1
+    if len(messages) <= keep + 1:
+        return messages
+    return [messages[0]] + messages[-keep:]
+
+
+def get_file_mtime(path):
+    """Get file mtime, or 0 if the file does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+
+def file_signature(path):
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Serialized JSON bodies keyed by name: (source file signature, body, etag)
+_json_body_cache = {}
+
+
+def cached_json_body(name, path, build):
+    """Return (body, etag) for build(), re-serializing only when path changes."""
+    sig = file_signature(path)
+    entry = _json_body_cache.get(name)
+    if entry is None or entry[0] != sig:
+        body = dumps_bytes(build())
+        etag = hashlib.md5(body).hexdigest()
+        entry = (sig, body, etag)
+        _json_body_cache[name] = entry
+    return entry[1], entry[2]
+
+
+def wait_for_mtime_change(path, last_mtime, timeout, interval=0.5):
+    """Block until the file's mtime differs from last_mtime or timeout expires.
+
+    Returns the current mtime (equal to last_mtime on timeout).
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        mtime = get_file_mtime(path)
+        if mtime != last_mtime:
+            return mtime
+        time.sleep(interval)
+    return last_mtime
+
+
+def mtime_events(path):
+    """Server-Sent Events stream that fires whenever the file changes."""
+    mtime = get_file_mtime(path)
+    yield f"data: {mtime}\n\n"
+    while True:
+        new_mtime = wait_for_mtime_change(path, mtime, Config.SSE_KEEPALIVE_SECONDS)
+        if new_mtime == mtime:
+            yield ": keepalive\n\n"
+        else:
+            mtime = new_mtime
+            yield f"data: {mtime}\n\n"
+
+
+def tape_events():
+    """Server-Sent Events stream that fires as soon as the tape is appended to."""
+    version = memory.version
+    yield f"data: {version}\n\n"
+    while True:
+        new_version = memory.wait_for_append(version, Config.SSE_KEEPALIVE_SECONDS)
+        if new_version == version:
+            yield ": keepalive\n\n"
+        else:
+            version = new_version
+            yield f"data: {version}\n\n"
+
+
+# Skills are loaded once and shared across requests; the manager reloads when
+# files are added to/removed from skills/ (reload_skills reloads it in place).
+_skill_mgr = None
+_skill_dir_mtime = None
+_skill_mgr_lock = threading.Lock()
+
+
+def get_skill_manager():
+    """Return the shared SkillManager, (re)loading skills when needed."""
+    global _skill_mgr, _skill_dir_mtime
+    from skill_manager import SkillManager
+
+    with _skill_mgr_lock:
+        if _skill_mgr is None:
+            _skill_mgr = SkillManager()
+        elif get_file_mtime(_skill_mgr.skills_dir) == _skill_dir_mtime:
+            return _skill_mgr
+
+        _skill_dir_mtime = get_file_mtime(_skill_mgr.skills_dir)
+        _skill_mgr.reload()
+        logger.info(f"Skills loaded: {len(_skill_mgr.skills)}")
+        return _skill_mgr
+
+
 @safe_operation(default_return="127.0.0.1")
 def get_local_ip():
     """Get local IP address."""
@@ -491,6 +737,25 @@ def get_local_ip():
     return ip
 
 
+# Caps concurrent scp/ssh sessions from request threads
+_scp_slots = threading.BoundedSemaphore(4)
+
+# scp shares one multiplexed ssh connection per worker (kept open for 10
+# minutes), so only the first dispatch pays for the ssh handshake
+_SSH_OPTS = [
+    "-o",
+    "StrictHostKeyChecking=no",
+    "-o",
+    "ConnectTimeout=5",
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    "ControlPath=/tmp/pibot-ssh-%C",
+    "-o",
+    "ControlPersist=600",
+]
+
+
 @safe_operation(default_return={"status": "error", "error": "dispatch failed"})
 def dispatch_task(cmd):
     """Dispatch task to worker."""
@@ -501,8 +766,16 @@ def dispatch_task(cmd):
     with open(local_file, "w") as f:
         json.dump(task_payload, f)
 
-    scp_cmd = f"scp -o StrictHostKeyChecking=no -o ConnectTimeout=5 {local_file} {Config.WORKER_USER}@{Config.WORKER_IP}:{Config.INBOX_REMOTE}/{task_id}.json"
-    result = subprocess.run(scp_cmd, shell=True, capture_output=True, timeout=10)
+    scp_cmd = [
+        "scp",
+        *_SSH_OPTS,
+        local_file,
+        f"{Config.WORKER_USER}@{Config.WORKER_IP}:{Config.INBOX_REMOTE}/{task_id}.json",
+    ]
+    with _scp_slots:
+        result = subprocess.run(
+            scp_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=10
+        )
 
     if result.returncode == 0:
         return {"status": "dispatched", "id": task_id}
@@ -517,10 +790,19 @@ def dispatch_task(cmd):
 # Dashboard data storage
 DASHBOARD_DATA_FILE = Path("dashboard_data.json")
 
+# Last parsed dashboard file: (file signature, data)
+_dashboard_cache = (None, None)
+
 
 def get_dashboard_data():
-    """Get dashboard data from shared file (can be updated by Agent)."""
-    if not DASHBOARD_DATA_FILE.exists():
+    """Get dashboard data from shared file (can be updated by Agent).
+
+    The parsed data is reused until the file changes, so callers must treat
+    the returned dict as read-only.
+    """
+    global _dashboard_cache
+    sig = file_signature(DASHBOARD_DATA_FILE)
+    if sig is None:
         # Return default data if file doesn't exist
         return {
             "weather": {
@@ -562,9 +844,13 @@ def get_dashboard_data():
             "last_updated": datetime.now().isoformat(),
         }
 
+    if _dashboard_cache[0] == sig:
+        return _dashboard_cache[1]
+
     try:
-        with open(DASHBOARD_DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        data = loads_json(DASHBOARD_DATA_FILE.read_bytes())
+        _dashboard_cache = (sig, data)
+        return data
     except:
         return (
             get_dashboard_data.__wrapped__()
@@ -688,7 +974,7 @@ def update_worker_status(worker_id, status, status_text):
 # ============================================================================
 
 try:
-    from flask import Flask, request, jsonify, render_template_string
+    from flask import Flask, Response, request, jsonify
 
     flask_available = True
 except ImportError:
@@ -696,8 +982,35 @@ except ImportError:
     flask_available = False
     Flask = None
 
+if flask_available and orjson is not None:
+    try:
+        from flask.json.provider import DefaultJSONProvider
+    except ImportError:  # Flask < 2.2 has no pluggable JSON provider
+        DefaultJSONProvider = None
+
+    if DefaultJSONProvider is not None:
+
+        class OrJSONProvider(DefaultJSONProvider):
+            """JSON provider backed by orjson.
+
+            Used by jsonify() and request.get_json() across all handlers.
+            """
+
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(
+                    obj, default=json_default, option=ORJSON_OPTIONS
+                ).decode("utf-8")
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+else:
+    DefaultJSONProvider = None
+
 if flask_available:
     app = Flask(__name__)
+    if DefaultJSONProvider is not None:
+        app.json = OrJSONProvider(app)
 
     HTML_BASE = """
 <!DOCTYPE html>
@@ -736,16 +1049,30 @@ if flask_available:
         const input = document.getElementById('user-input');
         const btn = document.getElementById('send-btn');
         let lastUpdate = 0;
+        let pending = null;  // assistant bubble being streamed into
+
+        // Single-pass Markdown: image | link | bold | inline code
+        const MD_RE = /!\[([^\]]*)\]\(([^)]+)\)|\[([^\]]+)\]\(([^)]+)\)|\*\*([^*]+)\*\*|`([^`]+)`/g;
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+
+        function escapeHtml(text) {
+            return text.replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+        }
+
+        // Link text and bold are rendered recursively, so nested markup
+        // (a link inside **...**, bold link text) still renders
+        function renderMarkdown(m, imgAlt, imgSrc, linkText, linkUrl, bold, code) {
+            if (imgSrc !== undefined) return `<img src="${imgSrc}" alt="${imgAlt}" style="max-width:100%; border-radius:8px; margin:4px 0;">`;
+            if (linkUrl !== undefined) return `<a href="${linkUrl}" target="_blank">${linkText.replace(MD_RE, renderMarkdown)}</a>`;
+            if (bold !== undefined) return `<strong>${bold.replace(MD_RE, renderMarkdown)}</strong>`;
+            return `<code style="background:#f0f0f0; padding:2px 6px; border-radius:4px;">${code}</code>`;
+        }
 
         function appendMsg(role, text) {
             const div = document.createElement('div');
             div.className = `message ${role}`;
-            let html = text
-                .replace(/!\[([^\]]*)\]\(([^)]+)\)/g, (m, alt, src) => `<img src="${src}" alt="${alt}" style="max-width:100%; border-radius:8px; margin:4px 0;">`)
-                .replace(/\[([^\]]+)\]\(([^)]+)\)/g, (m, text, url) => `<a href="${url}" target="_blank">${text}</a>`)
-                .replace(/\*\*([^*]+)\*\*/g, '<strong>$1</strong>')
-                .replace(/`([^`]+)`/g, '<code style="background:#f0f0f0; padding:2px 6px; border-radius:4px;">$1</code>');
-            div.innerHTML = html;
+            // Escape first, then render Markdown: one path for every message
+            div.innerHTML = escapeHtml(text).replace(MD_RE, renderMarkdown);
             chat.appendChild(div);
             chat.scrollTop = chat.scrollHeight;
         }
@@ -757,6 +1084,7 @@ if flask_available:
                 if (data.timestamp > lastUpdate) {
                     chat.innerHTML = '';
                     data.history.forEach(m => appendMsg(m.role, m.content));
+                    if (pending) chat.appendChild(pending);
                     lastUpdate = data.timestamp;
                 }
             } catch(e) { console.error('History load failed:', e); }
@@ -771,11 +1099,15 @@ if flask_available:
                 const res = await fetch('/api/chat', {
                     method: 'POST',
                     headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({msg: val})
+                    body: JSON.stringify({msg: val, stream: !!window.TextDecoderStream})
                 });
-                const data = await res.json();
-                if (data.error) {
-                    appendMsg('error', '⚠️ ' + data.error);
+                if ((res.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+                    await readReplyStream(res);
+                } else {
+                    const data = await res.json();
+                    if (data.error) {
+                        appendMsg('error', '⚠️ ' + data.error);
+                    }
                 }
                 setTimeout(loadHistory, 800);
             } catch(e) { 
@@ -784,26 +1116,103 @@ if flask_available:
             }
         }
 
+        // Show reply deltas as they arrive; the tape refresh then replaces
+        // the bubble with the stored (final) reply
+        async function readReplyStream(res) {
+            pending = document.createElement('div');
+            pending.className = 'message assistant';
+            chat.appendChild(pending);
+            const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buf = '';
+            try {
+                for (;;) {
+                    const {value, done} = await reader.read();
+                    if (done) break;
+                    buf += value;
+                    let i;
+                    while ((i = buf.indexOf('\\n\\n')) >= 0) {
+                        const ev = JSON.parse(buf.slice(6, i));  // strip "data: "
+                        buf = buf.slice(i + 2);
+                        if (ev.delta) pending.textContent += ev.delta;
+                        if (ev.error) appendMsg('error', '⚠️ ' + ev.error);
+                        chat.scrollTop = chat.scrollHeight;
+                    }
+                }
+            } finally {
+                pending.remove();
+                pending = null;
+            }
+        }
+
         btn.onclick = send;
         input.onkeypress = (e) => { if(e.key === 'Enter') send(); };
-        setInterval(loadHistory, 3000);
-        loadHistory();
+        if (window.EventSource) {
+            // Server pushes an event only when the tape changes
+            new EventSource('/api/history/stream').onmessage = () => loadHistory();
+        } else {
+            setInterval(loadHistory, 3000);
+            loadHistory();
+        }
     </script>
 </body>
 </html>
 """
 
+    def cached_response(body, etag, mimetype, cache_control):
+        """Send a prebuilt body, or 304 if the client already has it."""
+        headers = {"ETag": '"%s"' % etag, "Cache-Control": cache_control}
+        if etag in request.if_none_match:
+            return Response(status=304, headers=headers)
+        headers["Content-Length"] = str(len(body))
+        return Response(
+            body,
+            mimetype=mimetype,
+            headers=headers,
+            direct_passthrough=True,
+        )
+
+    # HTML_BASE only varies by title, so every variant is rendered once into
+    # bytes (plus precompressed copies); the page handlers just pick one.
+    _HTML_TITLES = {"desktop": "PiBot Desktop", "mobile": "PiBot Mobile"}
+    _HTML_VARIANTS = {}
+    _HTML_CACHE_CONTROL = "public, max-age=3600"
+
+    def build_html_variants():
+        """(Re)render all HTML_BASE variants, e.g. after the local IP changes."""
+        template = app.jinja_env.from_string(HTML_BASE)
+        ip = get_local_ip()
+        for name, title in _HTML_TITLES.items():
+            body = template.render(title=title, ip=ip).encode("utf-8")
+            compressed = {}  # Content-Encoding -> body, preferred first
+            if brotli is not None:
+                compressed["br"] = brotli.compress(body, quality=11)
+            compressed["gzip"] = gzip.compress(body, 9)
+            _HTML_VARIANTS[name] = (body, hashlib.md5(body).hexdigest(), compressed)
+
+    def html_response(name):
+        """Send a prebuilt page, precompressed if the client accepts it."""
+        body, etag, compressed = _HTML_VARIANTS[name]
+        for encoding, data in compressed.items():
+            if request.accept_encodings[encoding]:
+                response = cached_response(
+                    data, f"{etag}-{encoding}", "text/html", _HTML_CACHE_CONTROL
+                )
+                response.headers["Content-Encoding"] = encoding
+                break
+        else:
+            response = cached_response(body, etag, "text/html", _HTML_CACHE_CONTROL)
+        response.vary.add("Accept-Encoding")
+        return response
+
+    build_html_variants()
+
     @app.route("/")
     def index():
-        return render_template_string(
-            HTML_BASE, title="PiBot Desktop", ip=get_local_ip()
-        )
+        return html_response("desktop")
 
     @app.route("/mobile")
     def mobile():
-        return render_template_string(
-            HTML_BASE, title="PiBot Mobile", ip=get_local_ip()
-        )
+        return html_response("mobile")
 
     @app.route("/api/health")
     def health():
@@ -816,14 +1225,108 @@ if flask_available:
             }
         )
 
+    def cached_json_response(body, etag):
+        """Send a prebuilt JSON body, or 304 if the client already has it."""
+        return cached_response(body, etag, "application/json", "no-cache")
+
     @app.route("/api/history")
     def api_history():
-        history = memory.read(20)
+        def build():
+            history = memory.read(20)
+            ts = get_file_mtime(Config.TAPE_FILE)
+            return {"history": history, "timestamp": ts}
+
+        return cached_json_response(
+            *cached_json_body("history", Config.TAPE_FILE, build)
+        )
+
+    @app.route("/api/history/stream")
+    def api_history_stream():
+        """SSE stream notifying clients when the chat tape changes."""
+        return Response(
+            tape_events(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    def run_skill_calls(ai_reply, messages, skill_mgr):
+        """Execute <call_skill> requests in the reply until the LLM stops asking.
+
+        Returns (final reply, number of skill steps executed).
+        """
+        # Handle skill calls with multi-step execution
+        max_iterations = 10  # 防止无限循环
+        iteration = 0
+        current_reply = ai_reply
+
+        while skill_mgr and iteration < max_iterations:
+            match = CALL_SKILL_RE.search(current_reply)
+            if match is None:
+                break
+            iteration += 1
+            logger.info(f"Executing skill call (iteration {iteration})")
+
+            try:
+                content = match.group(1).strip()
+
+                if ":" in content:
+                    skill_name, args = content.split(":", 1)
+                    skill_result = skill_mgr.execute(skill_name, args)
+                else:
+                    skill_result = skill_mgr.execute(content)
+
+                # Follow-up with skill result (serialized once per step)
+                result_text = dumps_text(skill_result)
+                messages.append({"role": "assistant", "content": current_reply})
+                messages.append(
+                    {
+                        "role": "user",
+                        "content": f"技能执行结果：{result_text}\n\n请根据这个结果继续完成任务。如果需要执行更多操作，请继续使用 <call_skill> 标签。",
+                    }
+                )
+
+                # 继续对话以检查是否需要更多步骤
+                next_response = llm.chat(
+                    window_messages(messages, Config.SKILL_CONTEXT_WINDOW)
+                )
+                if next_response:
+                    current_reply = next_response.choices[0].message.content
+                    logger.info(
+                        f"LLM response after skill execution (iteration {iteration})"
+                    )
+                else:
+                    break
+
+            except Exception as e:
+                logger.error(f"Skill execution error (iteration {iteration}): {e}")
+                break
+
+        return current_reply, iteration
+
+    def chat_events(messages, skill_mgr):
+        """SSE body for /api/chat: streamed text deltas, then the final reply."""
+        parts = []
         try:
-            ts = os.path.getmtime(Config.TAPE_FILE) if Config.TAPE_FILE.exists() else 0
-        except:
-            ts = 0
-        return jsonify({"history": history, "timestamp": ts})
+            for delta in llm.chat_stream(messages):
+                parts.append(delta)
+                yield f"data: {dumps_text({'delta': delta})}\n\n"
+            ai_reply = "".join(parts)
+        except Exception as e:
+            # A stream cannot be resumed; redo the call without streaming. The
+            # final event carries the whole reply, replacing any partial text.
+            logger.warning(f"LLM stream failed, retrying without streaming: {e}")
+            response = llm.chat(messages)
+            ai_reply = response.choices[0].message.content if response else None
+
+        if not ai_reply:
+            logger.error("Failed to get response from LLM")
+            yield f"data: {dumps_text({'error': 'Failed to get response from LLM'})}\n\n"
+            return
+
+        current_reply, iteration = run_skill_calls(ai_reply, messages, skill_mgr)
+        memory.append("assistant", current_reply)
+        final = {"reply": current_reply, "steps": iteration}
+        yield f"data: {dumps_text(final)}\n\n"
 
     @app.route("/api/chat", methods=["POST"])
     def chat():
@@ -854,10 +1357,7 @@ if flask_available:
         skill_mgr = None
         skill_prompt = ""
         try:
-            from skill_manager import SkillManager
-
-            skill_mgr = SkillManager()
-            skill_mgr.load_skills()
+            skill_mgr = get_skill_manager()
             skill_prompt = skill_mgr.get_prompt()
         except Exception as e:
             logger.error(f"Skill error: {e}")
@@ -884,6 +1384,14 @@ if flask_available:
                 messages.append({"role": role, "content": content})
         messages.append({"role": "user", "content": user_msg})
 
+        if data.get("stream"):
+            # Server-Sent Events: reply deltas as they arrive, then the final reply
+            return Response(
+                chat_events(messages, skill_mgr),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
+
         # Call LLM
         response = llm.chat(messages)
         if not response:
@@ -892,51 +1400,7 @@ if flask_available:
             return jsonify({"reply": "", "error": error_msg})
 
         ai_reply = response.choices[0].message.content
-
-        # Handle skill calls with multi-step execution
-        max_iterations = 10  # 防止无限循环
-        iteration = 0
-        current_reply = ai_reply
-
-        while (
-            "<call_skill>" in current_reply and skill_mgr and iteration < max_iterations
-        ):
-            iteration += 1
-            logger.info(f"Executing skill call (iteration {iteration})")
-
-            try:
-                start = current_reply.find("<call_skill>") + 12
-                end = current_reply.find("</call_skill>")
-                content = current_reply[start:end].strip()
-
-                if ":" in content:
-                    skill_name, args = content.split(":", 1)
-                    skill_result = skill_mgr.execute(skill_name, args)
-                else:
-                    skill_result = skill_mgr.execute(content)
-
-                # Follow-up with skill result
-                messages.append({"role": "assistant", "content": current_reply})
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"技能执行结果：{json.dumps(skill_result, ensure_ascii=False)}\n\n请根据这个结果继续完成任务。如果需要执行更多操作，请继续使用 <call_skill> 标签。",
-                    }
-                )
-
-                # 继续对话以检查是否需要更多步骤
-                next_response = llm.chat(messages)
-                if next_response:
-                    current_reply = next_response.choices[0].message.content
-                    logger.info(
-                        f"LLM response after skill execution (iteration {iteration})"
-                    )
-                else:
-                    break
-
-            except Exception as e:
-                logger.error(f"Skill execution error (iteration {iteration}): {e}")
-                break
+        current_reply, iteration = run_skill_calls(ai_reply, messages, skill_mgr)
 
         # 保存最终回复到记忆
         memory.append("assistant", current_reply)
@@ -1237,87 +1701,59 @@ if flask_available:
             document.getElementById('workers-grid').innerHTML = html;
         }
 
-        // Load initially and refresh every 30 seconds
-        loadDashboardData();
-        setInterval(loadDashboardData, 30000);
+        // Reload whenever the dashboard data changes (fallback: every 30 seconds)
+        if (window.EventSource) {
+            new EventSource('/api/dashboard/stream').onmessage = () => loadDashboardData();
+        } else {
+            loadDashboardData();
+            setInterval(loadDashboardData, 30000);
+        }
     </script>
 </body>
 </html>
 """
 
-    @app.route("/dashboard")
-    def dashboard():
-        """Dashboard display - server-side rendered, no JavaScript."""
-        data = get_dashboard_data()
-        weather = data.get("weather", {})
-        current = weather.get("current", {})
-        forecast = weather.get("forecast", [])
-        todos = data.get("todos", [])
-        workers = data.get("workers", [])
-
-        from datetime import datetime
-
-        now = datetime.now()
-        # 简化日期显示适配7寸屏: 02-19 周三 14:30
-        datetime_str = now.strftime("%m-%d %a %H:%M")
-
-        # FontAwesome Icons
-        weather_icons = {
-            "sunny": '<i class="fas fa-sun" style="color:#f1c40f"></i>',
-            "cloudy": '<i class="fas fa-cloud" style="color:#bdc3c7"></i>',
-            "rainy": '<i class="fas fa-cloud-showers-heavy" style="color:#3498db"></i>',
-            "snowy": '<i class="fas fa-snowflake" style="color:#ecf0f1"></i>',
-            "stormy": '<i class="fas fa-bolt" style="color:#f39c12"></i>',
-            "foggy": '<i class="fas fa-smog" style="color:#95a5a6"></i>',
-        }
-        default_icon = '<i class="fas fa-cloud-sun" style="color:#f1c40f"></i>'
-
-        w_icon = weather_icons.get(current.get("condition"), default_icon)
-        w_temp = current.get("temp", "--")
-        w_humidity = current.get("humidity", "--")
-        w_location = weather.get("location", "Unknown")
-
-        # Build forecast HTML
-        forecast_html = ""
-        for day in forecast:
-            d_icon = weather_icons.get(day.get("condition"), default_icon)
-            forecast_html += f"<div style='text-align:center;padding:10px;background:#f8f9fa;border-radius:12px;'><div style='font-weight:bold;color:#667eea;font-size:0.9em;'>{day.get('day', '')}</div><div style='font-size:1.8em;margin:8px 0;'>{d_icon}</div><div style='font-size:0.9em;'>{day.get('high', '--')}° / {day.get('low', '--')}°</div></div>"
+    # Server-rendered dashboard, pre-encoded as UTF-8 bytes. Only the small
+    # dynamic fragments are encoded per request and spliced in with %b.
+    _DASH_WEATHER_ICONS = {
+        "sunny": b'<i class="fas fa-sun" style="color:#f1c40f"></i>',
+        "cloudy": b'<i class="fas fa-cloud" style="color:#bdc3c7"></i>',
+        "rainy": b'<i class="fas fa-cloud-showers-heavy" style="color:#3498db"></i>',
+        "snowy": b'<i class="fas fa-snowflake" style="color:#ecf0f1"></i>',
+        "stormy": b'<i class="fas fa-bolt" style="color:#f39c12"></i>',
+        "foggy": b'<i class="fas fa-smog" style="color:#95a5a6"></i>',
+    }
+    _DASH_DEFAULT_ICON = b'<i class="fas fa-cloud-sun" style="color:#f1c40f"></i>'
 
-        # Build todos HTML
-        todos_html = ""
-        if not todos:
-            todos_html = "<li style='padding:12px;background:#f8f9fa;border-radius:10px;margin-bottom:8px;color:#999;'>暂无待办事项</li>"
-        else:
-            for todo in todos:
-                done_style = (
-                    "text-decoration:line-through;color:#999;"
-                    if todo.get("done")
-                    else ""
-                )
-                icon = (
-                    '<i class="far fa-check-square"></i>'
-                    if todo.get("done")
-                    else '<i class="far fa-square"></i>'
-                )
-                todos_html += f"<li style='padding:10px;background:#f8f9fa;border-radius:10px;margin-bottom:6px;display:flex;align-items:center;gap:10px;{done_style}'>{icon} <span>{todo.get('text', '')}</span></li>"
+    _DASH_FDAY = "<div style='text-align:center;padding:10px;background:#f8f9fa;border-radius:12px;'><div style='font-weight:bold;color:#667eea;font-size:0.9em;'>%b</div><div style='font-size:1.8em;margin:8px 0;'>%b</div><div style='font-size:0.9em;'>%b° / %b°</div></div>".encode(
+        "utf-8"
+    )
+    _DASH_TODO_EMPTY = "<li style='padding:12px;background:#f8f9fa;border-radius:10px;margin-bottom:8px;color:#999;'>暂无待办事项</li>".encode(
+        "utf-8"
+    )
+    _DASH_TODO_ITEM = b"<li style='padding:10px;background:#f8f9fa;border-radius:10px;margin-bottom:6px;display:flex;align-items:center;gap:10px;%b'>%b <span>%b</span></li>"
+    _DASH_TODO_DONE = (
+        b"text-decoration:line-through;color:#999;",
+        b'<i class="far fa-check-square"></i>',
+    )
+    _DASH_TODO_OPEN = (b"", b'<i class="far fa-square"></i>')
+    _DASH_WORKER = b"<div style='text-align:center;padding:15px 10px;border-radius:12px;background:%b'><div style='font-size:2em;margin-bottom:8px;'>%b</div><div style='font-weight:bold;font-size:0.95em;'>%b</div><div style='font-size:0.85em;opacity:0.9;'>%b</div></div>"
+    _DASH_WORKER_STYLES = {
+        "active": (
+            b'<i class="fas fa-bolt"></i>',
+            b"linear-gradient(135deg,#11998e 0%,#38ef7d 100%);color:white;",
+        ),
+        "idle": (
+            b'<i class="fas fa-coffee"></i>',
+            b"linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;",
+        ),
+    }
+    _DASH_WORKER_OFFLINE = (
+        b'<i class="fas fa-times-circle"></i>',
+        b"#e9ecef;color:#666;",
+    )
 
-        # Build workers HTML
-        workers_html = ""
-        for worker in workers:
-            status = worker.get("status", "offline")
-            if status == "active":
-                icon = '<i class="fas fa-bolt"></i>'
-                bg = "linear-gradient(135deg,#11998e 0%,#38ef7d 100%);color:white;"
-            elif status == "idle":
-                icon = '<i class="fas fa-coffee"></i>'
-                bg = "linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;"
-            else:
-                icon = '<i class="fas fa-times-circle"></i>'
-                bg = "#e9ecef;color:#666;"
-
-            workers_html += f"<div style='text-align:center;padding:15px 10px;border-radius:12px;background:{bg}'><div style='font-size:2em;margin-bottom:8px;'>{icon}</div><div style='font-weight:bold;font-size:0.95em;'>{worker.get('name', '')}</div><div style='font-size:0.85em;opacity:0.9;'>{worker.get('statusText', '')}</div></div>"
-
-        html = f"""<!DOCTYPE html>
+    _DASH_SKELETON = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -1327,74 +1763,155 @@ if flask_available:
     <!-- FontAwesome -->
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
     <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: #333; min-height: 100vh; padding: 10px; margin: 0; font-size: 14px; overflow-x: hidden; }}
-        .dashboard {{ display: grid; grid-template-columns: 1fr 1fr; gap: 10px; max-width: 800px; margin: 0 auto; }}
-        .card {{ background: rgba(255,255,255,0.95); border-radius: 12px; padding: 15px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); overflow: hidden; }}
-        .header {{ grid-column: 1 / -1; text-align: center; color: white; padding: 10px; }}
-        .header h1 {{ font-size: 1.8em; margin: 0 0 5px 0; display: flex; justify-content: center; align-items: center; gap: 10px; }}
-        .datetime {{ font-size: 1.1em; opacity: 0.9; }}
-        .section-title {{ font-size: 1.1em; font-weight: bold; margin-bottom: 12px; color: #667eea; display: flex; align-items: center; gap: 8px; }}
-        .weather-current {{ display: flex; align-items: center; gap: 15px; margin-bottom: 15px; }}
-        .weather-icon {{ font-size: 3em; line-height: 1; }}
-        .weather-info h2 {{ font-size: 2.2em; margin: 0; line-height: 1.2; }}
-        .weather-info p {{ font-size: 0.9em; margin: 2px 0; color: #666; }}
-        .forecast-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; }}
-        .todo-list {{ list-style: none; padding: 0; margin: 0; max-height: 200px; overflow-y: auto; }}
-        .workers-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; }}
+        body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif; background: linear-gradient(135deg, #667eea 0%%, #764ba2 100%%); color: #333; min-height: 100vh; padding: 10px; margin: 0; font-size: 14px; overflow-x: hidden; }
+        .dashboard { display: grid; grid-template-columns: 1fr 1fr; gap: 10px; max-width: 800px; margin: 0 auto; }
+        .card { background: rgba(255,255,255,0.95); border-radius: 12px; padding: 15px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); overflow: hidden; }
+        .header { grid-column: 1 / -1; text-align: center; color: white; padding: 10px; }
+        .header h1 { font-size: 1.8em; margin: 0 0 5px 0; display: flex; justify-content: center; align-items: center; gap: 10px; }
+        .datetime { font-size: 1.1em; opacity: 0.9; }
+        .section-title { font-size: 1.1em; font-weight: bold; margin-bottom: 12px; color: #667eea; display: flex; align-items: center; gap: 8px; }
+        .weather-current { display: flex; align-items: center; gap: 15px; margin-bottom: 15px; }
+        .weather-icon { font-size: 3em; line-height: 1; }
+        .weather-info h2 { font-size: 2.2em; margin: 0; line-height: 1.2; }
+        .weather-info p { font-size: 0.9em; margin: 2px 0; color: #666; }
+        .forecast-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; }
+        .todo-list { list-style: none; padding: 0; margin: 0; max-height: 200px; overflow-y: auto; }
+        .workers-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; }
         
         /* 7寸屏幕优化 - 800x480 */
-        @media (max-width: 850px) {{
-            body {{ padding: 5px; font-size: 13px; }}
-            .dashboard {{ gap: 8px; }}
-            .card {{ padding: 12px; }}
-            .header h1 {{ font-size: 1.5em; }}
-            .weather-icon {{ font-size: 2.5em; }}
-            .weather-info h2 {{ font-size: 1.8em; }}
-            .forecast-grid {{ gap: 5px; }}
-            .workers-grid {{ gap: 8px; }}
-        }}
+        @media (max-width: 850px) {
+            body { padding: 5px; font-size: 13px; }
+            .dashboard { gap: 8px; }
+            .card { padding: 12px; }
+            .header h1 { font-size: 1.5em; }
+            .weather-icon { font-size: 2.5em; }
+            .weather-info h2 { font-size: 1.8em; }
+            .forecast-grid { gap: 5px; }
+            .workers-grid { gap: 8px; }
+        }
     </style>
 </head>
 <body>
     <div class="dashboard">
         <div class="header">
             <h1><i class="fas fa-robot"></i> PiBot Dashboard</h1>
-            <div class="datetime">{datetime_str}</div>
+            <div class="datetime">%b</div>
         </div>
         <div class="card">
-            <div class="section-title"><i class="fas fa-cloud-sun"></i> 天气 - {w_location}</div>
+            <div class="section-title"><i class="fas fa-cloud-sun"></i> 天气 - %b</div>
             <div class="weather-current">
-                <div class="weather-icon">{w_icon}</div>
+                <div class="weather-icon">%b</div>
                 <div class="weather-info">
-                    <h2>{w_temp}°C</h2>
-                    <p>湿度 {w_humidity}%</p>
+                    <h2>%b°C</h2>
+                    <p>湿度 %b%%</p>
                 </div>
             </div>
-            <div class="forecast-grid">{forecast_html}</div>
+            <div class="forecast-grid">%b</div>
         </div>
         <div class="card">
-            <div class="section-title"><i class="fas fa-clipboard-list"></i> 待办事项 ({len(todos)})</div>
-            <ul class="todo-list">{todos_html}</ul>
+            <div class="section-title"><i class="fas fa-clipboard-list"></i> 待办事项 (%b)</div>
+            <ul class="todo-list">%b</ul>
         </div>
         <div class="card" style="grid-column: 1 / -1;">
             <div class="section-title"><i class="fas fa-network-wired"></i> Worker 状态</div>
-            <div class="workers-grid">{workers_html}</div>
+            <div class="workers-grid">%b</div>
         </div>
     </div>
 </body>
-</html>"""
-        return html
-        return html
+</html>""".encode("utf-8")
+
+    def _to_bytes(value):
+        """Encode a dynamic dashboard value for %b interpolation."""
+        return str(value).encode("utf-8")
+
+    @app.route("/dashboard")
+    def dashboard():
+        """Dashboard display - server-side rendered, no JavaScript."""
+        data = get_dashboard_data()
+        weather = data.get("weather", {})
+        current = weather.get("current", {})
+        forecast = weather.get("forecast", [])
+        todos = data.get("todos", [])
+        workers = data.get("workers", [])
+
+        # 简化日期显示适配7寸屏: 02-19 周三 14:30
+        datetime_str = datetime.now().strftime("%m-%d %a %H:%M")
+
+        forecast_html = b"".join(
+            _DASH_FDAY
+            % (
+                _to_bytes(day.get("day", "")),
+                _DASH_WEATHER_ICONS.get(day.get("condition"), _DASH_DEFAULT_ICON),
+                _to_bytes(day.get("high", "--")),
+                _to_bytes(day.get("low", "--")),
+            )
+            for day in forecast
+        )
+
+        if not todos:
+            todos_html = _DASH_TODO_EMPTY
+        else:
+            todos_html = b"".join(
+                _DASH_TODO_ITEM
+                % (
+                    *(_DASH_TODO_DONE if todo.get("done") else _DASH_TODO_OPEN),
+                    _to_bytes(todo.get("text", "")),
+                )
+                for todo in todos
+            )
+
+        worker_parts = []
+        for worker in workers:
+            icon, bg = _DASH_WORKER_STYLES.get(
+                worker.get("status", "offline"), _DASH_WORKER_OFFLINE
+            )
+            worker_parts.append(
+                _DASH_WORKER
+                % (
+                    bg,
+                    icon,
+                    _to_bytes(worker.get("name", "")),
+                    _to_bytes(worker.get("statusText", "")),
+                )
+            )
+        workers_html = b"".join(worker_parts)
+
+        body = _DASH_SKELETON % (
+            _to_bytes(datetime_str),
+            _to_bytes(weather.get("location", "Unknown")),
+            _DASH_WEATHER_ICONS.get(current.get("condition"), _DASH_DEFAULT_ICON),
+            _to_bytes(current.get("temp", "--")),
+            _to_bytes(current.get("humidity", "--")),
+            forecast_html,
+            _to_bytes(len(todos)),
+            todos_html,
+            workers_html,
+        )
+        return Response(body, mimetype="text/html", direct_passthrough=True)
 
     @app.route("/api/dashboard/data")
     def dashboard_data():
         """API endpoint for dashboard data."""
-        return jsonify(
-            {
-                "weather": get_weather_data(),
-                "todos": get_todos(),
-                "workers": get_workers_status(),
+
+        def build():
+            data = get_dashboard_data()
+            return {
+                "weather": data.get("weather", {}),
+                "todos": data.get("todos", []),
+                "workers": data.get("workers", []),
             }
+
+        return cached_json_response(
+            *cached_json_body("dashboard", DASHBOARD_DATA_FILE, build)
+        )
+
+    @app.route("/api/dashboard/stream")
+    def dashboard_stream():
+        """SSE stream notifying clients when dashboard data changes."""
+        return Response(
+            mtime_events(DASHBOARD_DATA_FILE),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
         )
 
     @app.route("/api/todos", methods=["GET", "POST", "DELETE"])
@@ -1427,6 +1944,7 @@ if flask_available:
         success = toggle_todo_status(todo_id)
         return jsonify({"success": success})
 
+
 # ============================================================================
 # 9. 主入口
 # ============================================================================
@@ -1,9 +1,28 @@
 
 import os
 import importlib.util
+from importlib.machinery import SourceFileLoader
 import inspect
 import logging
 
+# Superseded copies of the core skills. core_enhanced_v2 registers the same
+# skill names (re-exporting the basics from core), so loading these as well
+# only duplicates import work and lets load order pick the winner.
+SHADOWED_MODULES = {"core", "core_enhanced", "core_fixed"}
+
+
+def _arity(func):
+    """Count positional parameters (a *args counts as one) without inspect.signature."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # builtins, functools.partial, callables: fall back to the slow path
+        return len(inspect.signature(func).parameters)
+    n = code.co_argcount + (1 if code.co_flags & inspect.CO_VARARGS else 0)
+    if inspect.ismethod(func):
+        n -= 1  # bound self
+    return n
+
+
 class SkillManager:
     def __init__(self, skills_dir=None):
         if not skills_dir:
@@ -14,6 +33,9 @@ class SkillManager:
             
         self.skills = {}
         self.skill_descriptions = {}
+        self.skill_arity = {}  # name -> parameter count, computed once at register
+        self._prompt_cache = None
+        self._modules = []  # loaded skill modules, for unload_skills() on reload
 
     def load_skills(self):
         """Load all python skills from skills directory"""
@@ -23,52 +45,86 @@ class SkillManager:
 
         logging.info(f"Loading skills from {self.skills_dir}...")
         
-        for filename in os.listdir(self.skills_dir):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                module_name = filename[:-3]
-                file_path = os.path.join(self.skills_dir, filename)
+        with os.scandir(self.skills_dir) as it:
+            entries = sorted(
+                (
+                    entry for entry in it
+                    if entry.name.endswith(".py") and not entry.name.startswith("__")
+                    and entry.name[:-3] not in SHADOWED_MODULES and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+
+        for entry in entries:
+            module_name = entry.name[:-3]
+            file_path = entry.path
+            
+            try:
+                # SourceFileLoader reads/writes __pycache__, so restarts reuse bytecode
+                loader = SourceFileLoader(module_name, file_path)
+                spec = importlib.util.spec_from_loader(module_name, loader)
+                module = importlib.util.module_from_spec(spec)
+                loader.exec_module(module)
+                self._modules.append(module)
                 
-                try:
-                    spec = importlib.util.spec_from_file_location(module_name, file_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    if hasattr(module, "register_skills"):
-                        # Smart detection of signature
-                        sig = inspect.signature(module.register_skills)
-                        if len(sig.parameters) >= 1:
-                            # New format: register_skills(manager)
-                            module.register_skills(self)
-                        else:
-                            # Old format: returns list of tuples
-                            skills_list = module.register_skills()
-                            for name, func, desc in skills_list:
-                                self.register(name, desc, func)
-                                
-                        logging.info(f"Loaded skills from {module_name}")
+                if hasattr(module, "register_skills"):
+                    # Smart detection of signature
+                    arity = _arity(module.register_skills)
+                    if arity >= 1:
+                        # New format: register_skills(manager)
+                        module.register_skills(self)
                     else:
-                        logging.warning(f"No register_skills found in {module_name}")
-                        
+                        # Old format: returns list of tuples
+                        skills_list = module.register_skills()
+                        for name, func, desc in skills_list:
+                            self.register(name, desc, func)
+                            
+                    logging.info(f"Loaded skills from {module_name}")
+                else:
+                    logging.warning(f"No register_skills found in {module_name}")
+                    
+            except Exception as e:
+                logging.error(f"Failed to load skill {module_name}: {e}", exc_info=True)
+
+    def reload(self):
+        """Drop all registered skills and load skills/ again in place."""
+        for module in self._modules:
+            # optional hook: let a skill flush state before its module is replaced
+            unload = getattr(module, "unload_skills", None)
+            if unload is not None:
+                try:
+                    unload()
                 except Exception as e:
-                    logging.error(f"Failed to load skill {module_name}: {e}", exc_info=True)
+                    logging.error(f"Failed to unload skill {module.__name__}: {e}", exc_info=True)
+        self._modules.clear()
+        importlib.invalidate_caches()  # make newly written files visible
+        self.skills.clear()
+        self.skill_descriptions.clear()
+        self.skill_arity.clear()
+        self._prompt_cache = None
+        self.load_skills()
 
     def register(self, name, description, func):
         self.skills[name] = func
         self.skill_descriptions[name] = description
+        self.skill_arity[name] = _arity(func)
+        self._prompt_cache = None
         # logging.info(f"Registered skill: {name}")
 
     def get_prompt(self):
         """Return prompt section describing available skills"""
         if not self.skills:
             return "No skills available."
-            
-        prompt = "Available Skills (Context Tools):\n"
-        for name, desc in self.skill_descriptions.items():
-            prompt += f"- {name}: {desc}\n"
-        
-        prompt += "\nTo call a skill, output: <call_skill>skill_name:args</call_skill>\n"
-        prompt += "Example: <call_skill>read_file:/var/log/syslog</call_skill>"
-        return prompt
+        if self._prompt_cache is not None:
+            return self._prompt_cache
+
+        lines = ["Available Skills (Context Tools):"]
+        lines.extend(f"- {name}: {desc}" for name, desc in sorted(self.skill_descriptions.items()))
+        lines.append("")
+        lines.append("To call a skill, output: <call_skill>skill_name:args</call_skill>")
+        lines.append("Example: <call_skill>read_file:/var/log/syslog</call_skill>")
+        self._prompt_cache = "\n".join(lines)
+        return self._prompt_cache
 
     def execute(self, skill_name, args=None):
         if skill_name not in self.skills:
@@ -77,8 +133,7 @@ class SkillManager:
         try:
             func = self.skills[skill_name]
             # Check if func accepts args
-            sig = inspect.signature(func)
-            if len(sig.parameters) > 0:
+            if self.skill_arity[skill_name] > 0:
                 return func(args) if args else func(None) # Handle Optional args safely? 
                 # Better: Check if args provided properly. 
                 # For now assume func handles its args (string usually)
@@ -3,12 +3,15 @@ PiBot V3 - Enhanced Skills Module
 包含技能管理功能：创建、列表、重载、帮助
 """
 
+import atexit
 import os
+import py_compile
+import re
+import shlex
 import subprocess
-import requests
+import threading
 from pathlib import Path
 import time
-from datetime import datetime
 
 # ============================================================================
 # Core Skills (Original)
@@ -21,11 +24,13 @@ def read_file(path):
         path = path.strip()
         if not os.path.exists(path):
             return f"Error: File '{path}' not found."
-        with open(path, "r") as f:
-            content = f.read(2048)  # Limit size
-            if len(content) == 2048:
-                content += "\n...(truncated)..."
-            return content
+        # Unbuffered binary read of the capped head, decoded once
+        with open(path, "rb", buffering=0) as f:
+            raw = f.read(2048)  # Limit size
+        content = raw.decode("utf-8", "replace")
+        if len(raw) == 2048:
+            content += "\n...(truncated)..."
+        return content
     except Exception as e:
         return f"Error reading file: {e}"
 
@@ -33,18 +38,18 @@ def read_file(path):
 def write_file(args):
     """Write/Append file. Format: PATH||CONTENT or PATH||APPEND||CONTENT"""
     try:
-        parts = args.split("||")
-        path = parts[0].strip()
+        # Only the first two separators matter; avoid splitting the payload
+        path, sep, rest = args.partition("||")
+        if not sep:
+            return "Error: Invalid format. Use PATH||CONTENT"
+        path = path.strip()
         mode = "w"
-        content = ""
+        content = rest
 
-        if len(parts) == 2:
-            content = parts[1]
-        elif len(parts) == 3 and parts[1].lower() == "append":
+        first, sep, tail = rest.partition("||")
+        if sep and first.lower() == "append":
             mode = "a"
-            content = parts[2]
-        else:
-            return "Error: Invalid format. Use PATH||CONTENT"
+            content = tail
 
         with open(path, mode) as f:
             f.write(content)
@@ -53,18 +58,65 @@ def write_file(args):
         return f"Error writing file: {e}"
 
 
+# Anything that needs /bin/sh to interpret (pipes, redirects, expansion, ...)
+_SHELL_META = re.compile(r"[;&|<>$`*?(){}\[\]~!#\\\n]")
+
+
 def run_shell(cmd):
     """Run shell command on Master (Local)"""
     try:
         # Security: Be careful with this!
-        res = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=10
-        )
+        # Plain commands are exec'd directly; only fall back to a shell when
+        # the command uses shell syntax or isn't an executable (cd, export...).
+        res = None
+        if not _SHELL_META.search(cmd):
+            try:
+                argv = shlex.split(cmd)
+                if argv:
+                    res = subprocess.run(
+                        argv, capture_output=True, text=True, timeout=10
+                    )
+            except (ValueError, OSError):
+                pass
+        if res is None:
+            res = subprocess.run(
+                cmd, shell=True, capture_output=True, text=True, timeout=10
+            )
         return f"Output:\n{res.stdout}\nError:\n{res.stderr}"
     except Exception as e:
         return f"Error running shell: {e}"
 
 
+# Shared session so repeated downloads reuse keep-alive connections.
+# requests is imported on first download: it is slow to import on a Pi and
+# install_skill is its only user here.
+_HTTP = None
+
+
+def _http_session():
+    """Return the shared requests session, creating it on first use."""
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP = session
+    return _HTTP
+
+
+# url -> conditional request headers from the last successful download
+_INSTALL_VALIDATORS = {}
+
+
 def install_skill(url_args):
     """Download a skill from a URL. Args: url (or url|filename)"""
     try:
@@ -80,19 +132,90 @@ def install_skill(url_args):
         target_path = Path("skills") / filename
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            with open(target_path, "w") as f:
-                f.write(response.text)
-            return (
-                f"Skill downloaded to {target_path}. Please restart Master to load it."
-            )
-        else:
-            return f"Download failed: {response.status_code}"
+        headers = _INSTALL_VALIDATORS.get(url, {}) if target_path.exists() else {}
+        with _http_session().get(url, headers=headers, timeout=10) as response:
+            if response.status_code == 304:
+                return f"Skill at {target_path} is already up to date."
+            if response.status_code != 200:
+                return f"Download failed: {response.status_code}"
+            # Python source is UTF-8 (PEP 3120); don't let requests guess
+            text = response.content.decode("utf-8")
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        with open(target_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        _INSTALL_VALIDATORS[url] = validators
+        # Warm __pycache__ so the first load skips compilation
+        py_compile.compile(str(target_path), doraise=False)
+        return f"Skill downloaded to {target_path}. Please restart Master to load it."
     except Exception as e:
         return f"Install failed: {e}"
 
 
+def _run_camera(argv):
+    """Run a capture tool without a shell; a missing binary counts as failure."""
+    try:
+        return subprocess.run(argv, capture_output=True)
+    except FileNotFoundError as e:
+        return subprocess.CompletedProcess(argv, 127, b"", str(e).encode())
+
+
+# Warm picamera2 instance: None = not tried yet, False = unavailable
+_CAM = None
+_CAM_LOCK = threading.Lock()
+
+
+def _capture_in_process(filepath):
+    """Capture with picamera2, keeping the camera open between shots.
+
+    Returns False when picamera2 is not installed or the camera can't be used,
+    so the caller can fall back to the command-line tools.
+    """
+    global _CAM
+    with _CAM_LOCK:
+        if _CAM is None:
+            try:
+                from picamera2 import Picamera2
+
+                cam = Picamera2()
+                cam.configure(cam.create_still_configuration(main={"size": (640, 480)}))
+                cam.start()
+                _CAM = cam
+            except Exception:
+                _CAM = False
+        if not _CAM:
+            return False
+        try:
+            _CAM.capture_file(str(filepath))
+            return True
+        except Exception:
+            # Drop the broken instance; the next shot opens the camera again
+            _release_camera()
+            return False
+
+
+def _release_camera():
+    """Stop and close the warm camera. Caller holds _CAM_LOCK."""
+    global _CAM
+    cam, _CAM = _CAM, None
+    if cam:
+        for release in (cam.stop, cam.close):
+            try:
+                release()
+            except Exception:
+                pass
+
+
+@atexit.register
+def _close_camera():
+    with _CAM_LOCK:
+        _release_camera()
+
+
 def take_photo(args=None):
     """Take a photo using system camera. Returns markdown image link."""
     try:
@@ -102,14 +225,20 @@ def take_photo(args=None):
         static_dir.mkdir(exist_ok=True)
         filepath = static_dir / filename
 
+        if _capture_in_process(filepath) and filepath.exists():
+            return f"![Live Photo](/static/{filename})"
+
         # Try libcamera (RPi) first, then fswebcam (USB)
-        cmd1 = f"libcamera-jpeg -o {filepath} -t 1 --width 640 --height 480 --nopreview"
-        res = subprocess.run(cmd1, shell=True, capture_output=True)
+        res = _run_camera(
+            ["libcamera-jpeg", "-o", str(filepath), "-t", "1"]
+            + ["--width", "640", "--height", "480", "--nopreview"]
+        )
 
         if res.returncode != 0:
             # Fallback to fswebcam
-            cmd2 = f"fswebcam -r 640x480 --no-banner {filepath}"
-            res = subprocess.run(cmd2, shell=True, capture_output=True)
+            res = _run_camera(
+                ["fswebcam", "-r", "640x480", "--no-banner", str(filepath)]
+            )
 
         if filepath.exists() and filepath.stat().st_size > 0:
             return f"![Live Photo](/static/{filename})"
@@ -162,6 +291,8 @@ def create_skill(args):
             return f"Error: Skill '{skill_name}' already exists at {skill_file}"
 
         # Generate skill template
+        from datetime import datetime
+
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         template = f'''"""
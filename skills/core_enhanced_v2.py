@@ -4,136 +4,118 @@ PiBot V3 - Enhanced Skills Module with Intelligent Template Generation
 """
 
 import os
-import subprocess
-import requests
+import sys
+import weakref
 from pathlib import Path
-import time
-from datetime import datetime
 import re
-import json
 import logging
 
 # ============================================================================
-# Core Skills (Original)
+# Core Skills (Original) - shared with core.py, which is not loaded on its own
 # ============================================================================
 
+try:
+    from skills.core import read_file, write_file, run_shell, install_skill, take_photo
+except ImportError:
+    # Loaded by path without the repo root on sys.path
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from core import read_file, write_file, run_shell, install_skill, take_photo
 
-def read_file(path):
-    """Read file content (safe check)"""
-    try:
-        path = path.strip()
-        if not os.path.exists(path):
-            return f"Error: File '{path}' not found."
-        with open(path, "r") as f:
-            content = f.read(2048)  # Limit size
-            if len(content) == 2048:
-                content += "\n...(truncated)..."
-            return content
-    except Exception as e:
-        return f"Error reading file: {e}"
-
-
-def write_file(args):
-    """Write/Append file. Format: PATH||CONTENT or PATH||APPEND||CONTENT"""
-    try:
-        parts = args.split("||")
-        path = parts[0].strip()
-        mode = "w"
-        content = ""
-
-        if len(parts) == 2:
-            content = parts[1]
-        elif len(parts) == 3 and parts[1].lower() == "append":
-            mode = "a"
-            content = parts[2]
-        else:
-            return "Error: Invalid format. Use PATH||CONTENT"
-
-        with open(path, mode) as f:
-            f.write(content)
-        return f"Success: Wrote to {path}"
-    except Exception as e:
-        return f"Error writing file: {e}"
-
-
-def run_shell(cmd):
-    """Run shell command on Master (Local)"""
-    try:
-        res = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=10
-        )
-        return f"Output:\n{res.stdout}\nError:\n{res.stderr}"
-    except Exception as e:
-        return f"Error running shell: {e}"
 
+# ============================================================================
+# Skill Template Generators (NEW - Smart Pattern Recognition)
+# ============================================================================
 
-def install_skill(url_args):
-    """Download a skill from a URL. Args: url (or url|filename)"""
-    try:
-        if "|" in url_args:
-            url, filename = url_args.split("|", 1)
-        else:
-            url = url_args
-            filename = url.split("/")[-1]
-            if not filename.endswith(".py"):
-                filename = "new_skill.py"
-
-        target_path = Path("skills") / filename
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            with open(target_path, "w") as f:
-                f.write(response.text)
-            return (
-                f"Skill downloaded to {target_path}. Please restart Master to load it."
-            )
-        else:
-            return f"Download failed: {response.status_code}"
-    except Exception as e:
-        return f"Install failed: {e}"
-
-
-def take_photo(args=None):
-    """Take a photo using system camera. Returns markdown image link."""
-    try:
-        timestamp = int(time.time())
-        filename = f"photo_{timestamp}.jpg"
-        static_dir = Path("static")
-        static_dir.mkdir(exist_ok=True)
-        filepath = static_dir / filename
-
-        cmd1 = f"libcamera-jpeg -o {filepath} -t 1 --width 640 --height 480 --nopreview"
-        res = subprocess.run(cmd1, shell=True, capture_output=True)
 
-        if res.returncode != 0:
-            cmd2 = f"fswebcam -r 640x480 --no-banner {filepath}"
-            res = subprocess.run(cmd2, shell=True, capture_output=True)
+# Skeletons are built once at import; generators only fill in the fields.
+# Literal braces in the generated code are doubled for str.format_map.
 
-        if filepath.exists() and filepath.stat().st_size > 0:
-            return f"![Live Photo](/static/{filename})"
-        else:
-            return f"Photo failed. Libcamera: {res.stderr}"
-    except Exception as e:
-        return f"Photo Exception: {e}"
 
+def _template_fields(skill_name, description):
+    """Placeholder values shared by all skill templates."""
+    from datetime import datetime
 
-# ============================================================================
-# Skill Template Generators (NEW - Smart Pattern Recognition)
-# ============================================================================
+    return {
+        "skill_name": skill_name,
+        "title": skill_name.capitalize(),
+        "description": description,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
 
 
-def generate_web_fetch_skill(skill_name, description):
-    """Generate web_fetch skill with actual implementation"""
-    template = f'''"""
-{skill_name.capitalize()} Skill
-Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+_TEMPLATE_WEB_FETCH = '''"""
+{title} Skill
+Created: {timestamp}
 Description: {description}
 """
 
-import requests
+import codecs
 import re
+import json
 import logging
+from email.message import Message
+
+# Shared session: repeated fetches reuse pooled keep-alive connections.
+# requests is imported on first fetch to keep skill loading fast.
+_HTTP = None
+
+
+def _session():
+    """Return the shared requests session, creating it on first use."""
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        _HTTP = requests.Session()
+        _HTTP.mount("https://", adapter)
+        _HTTP.mount("http://", adapter)
+    return _HTTP
+
+# Parse HTML in C when a parser is installed; regex stripping is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+MAX_BYTES = 512 * 1024  # Cap on bytes read from a page
+
+
+def _declared_charset(headers):
+    """Charset from the Content-Type header, defaulting to UTF-8"""
+    msg = Message()
+    msg["Content-Type"] = headers.get("content-type", "")
+    charset = msg.get_content_charset("utf-8")
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return "utf-8"
+    return charset
+
+
+def _html_text(html, encoding):
+    """Return (title, text) from raw HTML bytes in a single parse."""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        node = tree.css_first("title")
+        title = node.text(strip=True) if node else ""
+        root = tree.body or tree.root
+        text = root.text(separator=" ") if root else ""
+    elif lxml is not None:
+        doc = lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+        title = (doc.findtext(".//title") or "").strip()
+        text = doc.text_content()
+    else:
+        page = html.decode(encoding, "replace")
+        title_match = re.search(r'<title>(.*?)</title>', page, re.IGNORECASE | re.DOTALL)
+        title = title_match.group(1).strip() if title_match else ""
+        text = re.sub(r'<[^<]+?>', ' ', page)
+    return title or "No title", " ".join(text.split())
 
 def execute(args=None):
     """
@@ -148,6 +130,8 @@ def execute(args=None):
     Returns:
         str: Webpage content or processed result
     """
+    import requests  # cached after the first call; needed by the handlers below
+
     try:
         if not args:
             return "Error: Please provide a URL. Usage: web_fetch:URL"
@@ -170,21 +154,17 @@ def execute(args=None):
             "User-Agent": "Mozilla/5.0 (PiBot V3; WebFetch)"
         }}
         
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
+        with _session().get(url, headers=headers, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            body = response.raw.read(MAX_BYTES, decode_content=True)
+            encoding = _declared_charset(response.headers)
+
         # Extract content
         content_type = response.headers.get("content-type", "").lower()
         
         if "text/html" in content_type:
-            # HTML page - extract text content
-            text = re.sub(r'<[^<]+?>', ' ', response.text)  # Remove HTML tags
-            text = re.sub(r'\\s+', ' ', text)  # Normalize whitespace
-            text = text.strip()
-            
-            # Extract title
-            title_match = re.search(r'<title>(.*?)</title>', response.text, re.IGNORECASE)
-            title = title_match.group(1).strip() if title_match else "No title"
+            # HTML page - extract title and text content
+            title, text = _html_text(body, encoding)
             
             # Get first 500 chars for preview
             preview = text[:500]
@@ -199,27 +179,27 @@ def execute(args=None):
 
 💡 Instruction: {{instruction}}
 
-✅ Fetched successfully ({{len(response.text)}} bytes)"""
+✅ Fetched successfully ({{len(body)}} bytes)"""
             else:
                 return f"""📄 **{{title}}**
 
 📝 Content:
 {{preview}}
 
-✅ Fetched {{len(response.text)}} bytes from {{url}}"""
+✅ Fetched {{len(body)}} bytes from {{url}}"""
         elif "application/json" in content_type:
             # JSON data
             try:
-                data = response.json()
+                data = json.loads(body)
                 json_str = json.dumps(data, indent=2, ensure_ascii=False)[:500]
                 if len(json.dumps(data)) > 500:
                     json_str += "..."
-                return f"📦 JSON Data:\\n```json\\n{{json_str}}\\n```\\n✅ Fetched {{len(response.text)}} bytes"
+                return f"📦 JSON Data:\\n```json\\n{{json_str}}\\n```\\n✅ Fetched {{len(body)}} bytes"
             except:
-                return f"📦 JSON (raw): {{response.text[:500]}}"
+                return f"📦 JSON (raw): {{body[:500].decode(encoding, 'replace')}}"
         else:
             # Other content type
-            return f"📄 {{content_type}}\\nContent length: {{len(response.text)}} bytes\\nPreview: {{response.text[:200]}}..."
+            return f"📄 {{content_type}}\\nContent length: {{len(body)}} bytes\\nPreview: {{body[:200].decode(encoding, 'replace')}}..."
             
     except requests.exceptions.Timeout:
         return "Error: Request timeout (>15s). The server may be slow or unreachable."
@@ -244,20 +224,20 @@ def register_skills(skill_manager):
     )
 '''
 
-    return template
 
-
-def generate_shell_cmd_skill(skill_name, description):
-    """Generate shell command execution skill"""
-    template = f'''"""
-{skill_name.capitalize()} Skill
-Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+_TEMPLATE_SHELL_CMD = '''"""
+{title} Skill
+Created: {timestamp}
 Description: {description}
 """
 
+import re
 import subprocess
 import logging
 
+# Dangerous commands, matched in a single pass
+_DANGER = re.compile(r"rm\\s+-rf\\s+/|mkfs|dd\\s+if=|:\\(\\)\\s*\\{{\\s*:\\|:&?\\s*\\}};")
+
 def execute(args=None):
     """
     Execute shell command safely.
@@ -275,10 +255,8 @@ def execute(args=None):
         cmd = args.strip()
         
         # Security check: block dangerous commands
-        dangerous_patterns = ["rm -rf /", "mkfs", "dd if=", ":(){" + ":|: };"]
-        for pattern in dangerous_patterns:
-            if pattern in cmd:
-                return f"Error: Dangerous command blocked for safety: {{cmd[:50]}}"
+        if _DANGER.search(cmd):
+            return f"Error: Dangerous command blocked for safety: {{cmd[:50]}}"
 
         # Execute with timeout
         result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
@@ -315,14 +293,10 @@ def register_skills(skill_manager):
     )
 '''
 
-    return template
-
 
-def generate_default_skill(skill_name, description):
-    """Generate generic skill template"""
-    template = f'''"""
-{skill_name.capitalize()} Skill
-Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+_TEMPLATE_DEFAULT = '''"""
+{title} Skill
+Created: {timestamp}
 Description: {description}
 """
 
@@ -372,7 +346,20 @@ def register_skills(skill_manager):
     )
 '''
 
-    return template
+
+def generate_web_fetch_skill(skill_name, description):
+    """Generate web_fetch skill with actual implementation"""
+    return _TEMPLATE_WEB_FETCH.format_map(_template_fields(skill_name, description))
+
+
+def generate_shell_cmd_skill(skill_name, description):
+    """Generate shell command execution skill"""
+    return _TEMPLATE_SHELL_CMD.format_map(_template_fields(skill_name, description))
+
+
+def generate_default_skill(skill_name, description):
+    """Generate generic skill template"""
+    return _TEMPLATE_DEFAULT.format_map(_template_fields(skill_name, description))
 
 
 # ============================================================================
@@ -380,6 +367,46 @@ def register_skills(skill_manager):
 # ============================================================================
 
 
+# Name patterns that get a generated implementation, checked in order.
+# Anchored prefixes instead of a leading .* (web_fetch, *_fetch, shell*cmd, *cmd).
+# Each entry carries the feature list shown in create_skill's reply.
+_PATTERN_MATCHERS = [
+    (
+        re.compile(r"[a-z0-9_]*fetch", re.IGNORECASE),
+        generate_web_fetch_skill,
+        "   - Web fetching with requests library\n"
+        "   - HTML tag removal and text extraction\n"
+        "   - JSON data support\n"
+        "   - Error handling and timeouts\n",
+    ),
+    (
+        re.compile(r"[a-z0-9_]*cmd", re.IGNORECASE),
+        generate_shell_cmd_skill,
+        "   - Shell command execution\n"
+        "   - Security checks for dangerous commands\n"
+        "   - Timeout protection (30s)\n"
+        "   - Stdout/stderr capture\n",
+    ),
+]
+
+# Relative to the working directory, like the rest of the skill tooling
+_SKILLS_DIR = Path("skills")
+
+
+def _fsync_dir(path):
+    """Persist a directory entry (new file name) after creating a file in it."""
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Skill names: spaces/hyphens become underscores, must start with a letter
+_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+_NAME_RE = re.compile(r"[a-z][a-z0-9_]*")
+
+
 def create_skill(args):
     """
     Create a new skill with intelligent template generation.
@@ -410,31 +437,22 @@ def create_skill(args):
             return "Error: Please provide skill name.\nUsage: create_skill:name||description"
 
         # Validate skill name
-        skill_name = skill_name.strip().lower().replace(" ", "_").replace("-", "_")
-        if not skill_name.isidentifier() or not skill_name[0].isalpha():
+        skill_name = skill_name.strip().lower().translate(_NAME_TRANS)
+        if not _NAME_RE.fullmatch(skill_name):
             return f"Error: Invalid skill name '{skill_name}'.\nUse letters, numbers, underscores, start with letter."
 
-        skills_dir = Path("skills")
-        skills_dir.mkdir(exist_ok=True)
-        skill_file = skills_dir / f"{skill_name}.py"
-
-        # Check if skill already exists
-        if skill_file.exists():
-            return f"Error: Skill '{skill_name}' already exists at {skill_file}"
+        skill_file = _SKILLS_DIR / f"{skill_name}.py"
 
         # Intelligent template generation based on skill name pattern
-        pattern_matchers = [
-            (r"^web_fetch", generate_web_fetch_skill),
-            (r".*_?fetch", generate_web_fetch_skill),
-            (r"shell.*cmd", generate_shell_cmd_skill),
-            (r".*_?cmd", generate_shell_cmd_skill),
-        ]
-
         template = None
-        for pattern, generator in pattern_matchers:
-            if re.match(pattern, skill_name, re.IGNORECASE):
-                logging.info(f"Matched pattern: {pattern}, using intelligent generator")
+        smart_features = None  # set when a smart template was used
+        for pattern, generator, features in _PATTERN_MATCHERS:
+            if pattern.match(skill_name):
+                logging.info(
+                    f"Matched pattern: {pattern.pattern}, using intelligent generator"
+                )
                 template = generator(skill_name, description)
+                smart_features = features
                 break
 
         # Default to generic template if no pattern matched
@@ -442,38 +460,49 @@ def create_skill(args):
             logging.info(f"No pattern matched, using default template")
             template = generate_default_skill(skill_name, description)
 
-        # Write skill file
-        with open(skill_file, "w") as f:
+        # O_EXCL makes "already exists?" and the create one atomic call;
+        # skills/ is only created if the first attempt finds it missing
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+        try:
+            try:
+                fd = os.open(skill_file, flags, 0o644)
+            except FileNotFoundError:
+                _SKILLS_DIR.mkdir(parents=True, exist_ok=True)
+                fd = os.open(skill_file, flags, 0o644)
+        except FileExistsError:
+            return f"Error: Skill '{skill_name}' already exists at {skill_file}"
+
+        # Write skill file and make it durable: the manager reloads straight away,
+        # and a power cut must not leave an empty skill behind
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
             f.write(template)
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_dir(_SKILLS_DIR)
 
         # Enhanced success message
-        is_smart = (
-            "✨ Smart template"
-            if template != generate_default_skill(skill_name, description)
-            else "📝 Standard template"
-        )
+        is_smart = "✨ Smart template" if smart_features else "📝 Standard template"
 
-        result = f"""✅ Skill '{skill_name}' created successfully! {is_smart}
+        parts = [f"""✅ Skill '{skill_name}' created successfully! {is_smart}
 
 📁 Location: {skill_file.absolute()}
 📝 Description: {description}
 
 📚 Implementation Details:
-"""
+"""]
 
-        if template != generate_default_skill(skill_name, description):
-            result += "\n🤖 Auto-generated implementation included:\n"
-            result += "   - Web fetching with requests library\n"
-            result += "   - HTML tag removal and text extraction\n"
-            result += "   - JSON data support\n"
-            result += "   - Error handling and timeouts\n"
+        if smart_features:
+            parts.append("\n🤖 Auto-generated implementation included:\n")
+            parts.append(smart_features)
         else:
-            result += "\n📝 Next Steps:\n"
-            result += "1. Edit the skill file to implement your logic\n"
-            result += "   Command: nano skills/{skill_name}.py\n"
-            result += "2. Find the execute() function and add your code\n"
+            parts.append(
+                "\n📝 Next Steps:\n"
+                "1. Edit the skill file to implement your logic\n"
+                f"   Command: nano skills/{skill_name}.py\n"
+                "2. Find the execute() function and add your code\n"
+            )
 
-        result += f"""
+        parts.append(f"""
 3. Test the skill
    Command: <call_skill>{skill_name}:test_args</call_skill>
 
@@ -482,14 +511,119 @@ def create_skill(args):
 
 💡 Quick Test:
    <call_skill>{skill_name}:https://example.com</call_skill>
-"""
+""")
 
+        result = "".join(parts)
         return result
 
     except Exception as e:
         return f"Error creating skill: {e}"
 
 
+# path -> (mtime, size, desc, impl_status); skips re-reading unchanged files
+_LIST_CACHE = {}
+_HEAD_BYTES = 2048  # Docstring and template markers live up top
+_DOC_RE = re.compile(r'"""(.*?)(?:"""|\Z)', re.DOTALL)
+# One pass over the docstring: group 1 is a "Description:" line anywhere in it
+# (tried once, at the start); otherwise group 2 is the first non-empty line
+# that isn't "Created:"
+_DESC_RE = re.compile(
+    r"\A(?=[\s\S]*?^Description:\s*(.+)$)|^(?!Created:)[ \t]*(\S.*)$", re.MULTILINE
+)
+
+
+def _read_heads(paths):
+    """Read the first _HEAD_BYTES of each file.
+
+    All files are opened and hinted with POSIX_FADV_WILLNEED before the first
+    read, so on a cold cache the kernel fetches them together instead of one
+    blocking read at a time. Returns {path: bytes or OSError}.
+    """
+    heads = {}
+    fds = {}
+    try:
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError as e:
+                heads[path] = e
+                continue
+            fds[path] = fd
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, _HEAD_BYTES, os.POSIX_FADV_WILLNEED)
+        for path, fd in fds.items():
+            try:
+                heads[path] = os.pread(fd, _HEAD_BYTES, 0)
+            except OSError as e:
+                heads[path] = e
+    finally:
+        for fd in fds.values():
+            os.close(fd)
+    return heads
+
+
+def _describe_skill_head(raw):
+    """Return (description, implementation status) from a skill file's head."""
+    content = raw.decode("utf-8", "replace")
+    desc = "No description"
+    m = _DOC_RE.search(content)
+    if m:
+        doc = m.group(1).strip()
+        d = _DESC_RE.search(doc)
+        if d and d.group(1) is not None:
+            desc = d.group(1).strip()
+        elif d and doc.count("\n", 0, d.start(2)) < 5:  # only the first five lines
+            desc = d.group(2).strip()
+
+    # Check if it has implementation beyond TODO
+    has_impl = "# TODO:" not in content or 'return f"Executed' not in content
+    return desc, "✅" if has_impl else "🔧 Template"
+
+
+def _describe_skill_files(entries):
+    """Return [(entry, stat or None, desc, impl_status)], reading only changed files."""
+    rows = []
+    misses = []
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            st = None
+        cached = _LIST_CACHE.get(entry.path)
+        if st is not None and cached and cached[:2] == (st.st_mtime, st.st_size):
+            rows.append((entry, st, cached[2], cached[3]))
+        else:
+            rows.append((entry, st, None, None))
+            misses.append(entry.path)
+
+    heads = _read_heads(misses) if misses else {}
+    for i, (entry, st, desc, impl_status) in enumerate(rows):
+        if desc is not None:
+            continue
+        raw = heads[entry.path]
+        if isinstance(raw, OSError):
+            rows[i] = (entry, st, f"Error reading: {raw}", "❓")
+            continue
+        desc, impl_status = _describe_skill_head(raw)
+        if st is not None:
+            _LIST_CACHE[entry.path] = (st.st_mtime, st.st_size, desc, impl_status)
+        rows[i] = (entry, st, desc, impl_status)
+    return rows
+
+
+# Last formatted list_skills reply, keyed on every file's (name, size, mtime)
+_LIST_OUTPUT = {"key": None, "value": None}
+
+
+def _entry_signature(entry):
+    """(name, size, mtime_ns) of a DirEntry, using its cached stat."""
+    try:
+        st = entry.stat()
+    except OSError:
+        return (entry.name, None, None)
+    return (entry.name, st.st_size, st.st_mtime_ns)
+
+
 def list_skills(args=None):
     """
     List all available skills with descriptions and sizes.
@@ -501,66 +635,37 @@ def list_skills(args=None):
         str: Formatted list of skills
     """
     try:
-        skills_dir = Path("skills")
-        if not skills_dir.exists():
+        try:
+            with os.scandir(_SKILLS_DIR) as it:
+                entries = sorted(
+                    (
+                        e
+                        for e in it
+                        if e.name.endswith(".py")
+                        and not e.name.startswith("__")
+                        and e.is_file()
+                    ),
+                    key=lambda e: e.name,
+                )
+        except FileNotFoundError:
             return "No skills directory found."
-
-        skill_files = list(skills_dir.glob("*.py"))
-        if not skill_files:
+        if not entries:
             return "No skills found."
 
-        result = "📚 Available Skills:\n\n"
+        key = tuple(_entry_signature(e) for e in entries)
+        if key == _LIST_OUTPUT["key"]:
+            return _LIST_OUTPUT["value"]
 
-        for skill_file in sorted(skill_files):
-            if skill_file.name.startswith("__"):
-                continue
-
-            # Get file size
-            try:
-                size_kb = skill_file.stat().st_size / 1024
-                size_info = f" ({size_kb:.1f}KB)"
-            except:
-                size_info = ""
+        parts = ["📚 Available Skills:\n"]
 
-            # Extract description
-            try:
-                with open(skill_file, "r") as f:
-                    content = f.read()
-                    if '"""' in content:
-                        parts = content.split('"""')
-                        if len(parts) >= 2:
-                            docstring_lines = parts[1].strip().split("\n")
-                            for line in docstring_lines[:5]:
-                                if line.startswith("Description:"):
-                                    desc = line.split("Description:", 1)[1].strip()
-                                    break
-                                elif line.strip() and not line.startswith("Created:"):
-                                    desc = line.strip()
-                                    break
-                            else:
-                                desc = "No description"
-                        else:
-                            desc = "No description"
-                    else:
-                        desc = "No description"
-            except Exception as e:
-                desc = f"Error reading: {e}"
-
-            # Check if it has implementation beyond TODO
-            try:
-                with open(skill_file, "r") as f:
-                    content = f.read()
-                    has_impl = (
-                        "# TODO:" not in content or 'return f"Executed' not in content
-                    )
-                impl_status = "✅" if has_impl else "🔧 Template"
-            except:
-                impl_status = "❓"
+        for entry, st, desc, impl_status in _describe_skill_files(entries):
+            size_info = f" ({st.st_size / 1024:.1f}KB)" if st is not None else ""
+            parts.append(f"• **{entry.name[:-3]}**{size_info} {impl_status}: {desc}")
 
-            result += f"• **{skill_file.stem}**{size_info} {impl_status}: {desc}\n"
-
-        result += f"\n💡 Total: {len([f for f in skill_files if not f.name.startswith('__')])} skills"
-        return result.strip()
+        parts.append(f"\n💡 Total: {len(entries)} skills")
+        result = "\n".join(parts)
+        _LIST_OUTPUT.update(key=key, value=result)
+        return result
 
     except Exception as e:
         return f"Error listing skills: {e}"
@@ -568,8 +673,7 @@ def list_skills(args=None):
 
 def reload_skills(args=None):
     """
-    Signal skill manager to reload skills.
-    Creates a marker file that master_hub.py checks.
+    Reload all skills in the running skill manager.
 
     Args:
         args: Ignored
@@ -578,40 +682,23 @@ def reload_skills(args=None):
         str: Status message
     """
     try:
-        marker = Path(".reload_skills")
-        marker.touch()
-
-        # Check current skills
-        skills_dir = Path("skills")
-        if skills_dir.exists():
-            skill_count = len(list(skills_dir.glob("*.py")))
-            if skill_count > 0:
-                return f"""✅ Reload signal sent!
-
-📊 Found {skill_count} skill files
-💡 Skills will be reloaded on next API call
-🔄 New chat requests will use updated skills
-🔍 Tip: Use 'list_skills' to verify loaded skills"""
-            else:
-                return "✅ Reload signal sent! (No skills found)"
-        else:
-            return "✅ Reload signal sent! (No skills directory)"
+        manager = _MANAGER() if _MANAGER is not None else None
+        if manager is None:
+            return "Error: No skill manager attached. Restart to reload skills."
 
-    except Exception as e:
-        return f"Error signaling reload: {e}"
+        _LIST_OUTPUT["key"] = None
+        manager.reload()
+        return f"""✅ Skills reloaded!
 
+📊 Loaded {len(manager.skills)} skills
+🔄 The updated skills are available immediately
+🔍 Tip: Use 'list_skills' to verify loaded skills"""
 
-def skill_help(args=None):
-    """
-    Show help for creating and managing skills.
+    except Exception as e:
+        return f"Error reloading skills: {e}"
 
-    Args:
-        args: Ignored
 
-    Returns:
-        str: Help text
-    """
-    return """🛠️ PiBot Skill Management Help
+_SKILL_HELP_TEXT = """🛠️ PiBot Skill Management Help
 
 📌 Available Commands:
 
@@ -635,7 +722,7 @@ def skill_help(args=None):
 
 3️⃣ **reload_skills** - Reload skill registry
    Usage: <call_skill>reload_skills</call_skill>
-   Effect: Skills reload on next chat request
+   Effect: Skills reload immediately
 
 4️⃣ **skill_help** - Show this help message
    Usage: <call_skill>skill_help</call_skill>
@@ -693,10 +780,26 @@ New skills appear after restart or reload.
 """
 
 
+def skill_help(args=None):
+    """
+    Show help for creating and managing skills.
+
+    Args:
+        args: Ignored
+
+    Returns:
+        str: Help text
+    """
+    return _SKILL_HELP_TEXT
+
+
 # ============================================================================
 # Skill Registration
 # ============================================================================
 
+# Manager that loaded this module, for reload_skills
+_MANAGER = None
+
 
 def register_skills(skill_manager):
     """
@@ -705,6 +808,9 @@ def register_skills(skill_manager):
     Args:
         skill_manager: SkillManager instance
     """
+    global _MANAGER
+    _MANAGER = weakref.ref(skill_manager)
+
     # Original core skills
     skill_manager.register("read_file", "Read file content. Args: path", read_file)
     skill_manager.register(
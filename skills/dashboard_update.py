@@ -7,31 +7,162 @@ SKILL CONTRACT:
 - 返回结构化结果
 """
 
+import atexit
 import json
+import logging
 import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Dashboard 数据存储路径
 DASHBOARD_DATA_FILE = Path("dashboard_data.json")
 
+# 后台写线程的合并窗口（秒）：窗口内的多次保存只落盘最后一次
+_FLUSH_INTERVAL = 0.1
+
+# update_worker 的状态别名 -> 显示状态（只读，worker.update() 会复制其中的值）
+_WORKER_STATUS_MAP = {
+    "working": {"status": "active", "statusText": "工作中"},
+    "active": {"status": "active", "statusText": "工作中"},
+    "busy": {"status": "active", "statusText": "忙碌"},
+    "idle": {"status": "idle", "statusText": "闲置"},
+    "free": {"status": "idle", "statusText": "闲置"},
+    "offline": {"status": "offline", "statusText": "离线"},
+    "down": {"status": "offline", "statusText": "离线"}
+}
+
+
+def _parse_dashboard_data(raw: bytes) -> Dict[str, Any]:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 def _load_dashboard_data() -> Dict[str, Any]:
-    """加载当前 dashboard 数据"""
-    if not DASHBOARD_DATA_FILE.exists():
-        return _get_default_data()
+    """加载当前 dashboard 数据（优先返回尚未落盘的最新快照）"""
+    raw = _writer.pending()
+    if raw is None:
+        try:
+            raw = DASHBOARD_DATA_FILE.read_bytes()
+        except FileNotFoundError:
+            return _get_default_data()
     try:
-        with open(DASHBOARD_DATA_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except:
+        return _parse_dashboard_data(raw)
+    except ValueError:
         return _get_default_data()
 
 
+def _dump_dashboard_data(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _write_dashboard_file(payload: bytes):
+    """先写临时文件再原子替换，读者不会看到写了一半的 JSON"""
+    tmp = DASHBOARD_DATA_FILE.with_suffix('.json.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, DASHBOARD_DATA_FILE)
+
+
+class _DashboardWriter:
+    """
+    后台写线程：Agent 连续调用 dashboard_update 时，多次保存合并为一次落盘，
+    只写入最新的一份快照。
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending = None
+        self._written = None  # 上次落盘的内容
+        self._thread = None
+        self._closed = False
+        self._error = None  # 后台写盘最近一次失败的异常，成功写盘后清除
+
+    def pending(self) -> Optional[bytes]:
+        return self._pending
+
+    def error(self) -> Optional[Exception]:
+        return self._error
+
+    def enqueue(self, payload: bytes):
+        with self._cond:
+            self._pending = payload
+            closed = self._closed
+            if not closed and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='dashboard-writer', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        if closed:
+            # 写线程已停止（模块已卸载），直接同步写盘
+            self.flush()
+
+    def flush(self):
+        """同步写出待保存的快照（进程退出时调用）"""
+        with self._io_lock:
+            payload = self._pending
+            if payload is None:
+                return
+            # 与上次落盘字节相同（如重复的心跳）则不再写盘
+            if payload != self._written:
+                _write_dashboard_file(payload)
+                self._written = payload
+            with self._cond:
+                # 写盘期间若有新快照入队，保留给下一轮
+                if self._pending is payload:
+                    self._pending = None
+
+    def close(self):
+        """停止写线程并写出最后一份快照（模块卸载时调用）"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _run(self):
+        try:
+            while True:
+                with self._cond:
+                    while self._pending is None and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                time.sleep(_FLUSH_INTERVAL)
+                try:
+                    self.flush()
+                    self._error = None
+                except Exception as e:
+                    self._error = e
+                    logging.error(f"[dashboard_update] 保存 Dashboard 数据失败: {e}")
+                    with self._cond:
+                        self._cond.wait(1.0)
+        finally:
+            # 线程意外退出时清掉引用，下次 enqueue 会重新启动
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+
+_writer = _DashboardWriter()
+atexit.register(_writer.flush)
+
+
 def _save_dashboard_data(data: Dict[str, Any]):
-    """保存 dashboard 数据"""
-    with open(DASHBOARD_DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """保存 dashboard 数据（序列化后交给后台写线程；数据未变化时 handler 不调用）"""
+    _writer.enqueue(_dump_dashboard_data(data))
 
 
 def _get_default_data() -> Dict[str, Any]:
@@ -62,6 +193,156 @@ def _get_default_data() -> Dict[str, Any]:
     }
 
 
+def _do_add_todo(parts):
+    if len(parts) < 2:
+        return {"success": False, "error": "Missing todo text", "message": "请提供待办事项内容", "data": None}
+    
+    # 只读一次时钟：毫秒时间戳作 ID，同一时刻生成 created
+    now_ns = time.time_ns()
+    data = _load_dashboard_data()
+    todos = data["todos"]
+    todo_id = now_ns // 1_000_000
+    if todos and todos[-1]["id"] >= todo_id:
+        # 同一毫秒内连续添加时保持 ID 唯一
+        todo_id = todos[-1]["id"] + 1
+    todo = {
+        "id": todo_id,
+        "text": parts[1],
+        "done": False,
+        "created": datetime.fromtimestamp(now_ns / 1e9).isoformat()
+    }
+    todos.append(todo)
+    _save_dashboard_data(data)
+    return {
+        "success": True,
+        "message": f"已添加待办: {parts[1]}",
+        "data": {"todo": todo, "total": len(data["todos"])}
+    }
+
+
+def _do_complete_todo(parts):
+    if len(parts) < 2:
+        return {"success": False, "error": "Missing todo id", "message": "请提供待办ID", "data": None}
+    
+    todo_id = int(parts[1])
+    data = _load_dashboard_data()
+    todo = next((t for t in data["todos"] if t["id"] == todo_id), None)
+    if todo is None:
+        return {"success": False, "error": "Todo not found", "message": "找不到该待办事项", "data": None}
+    
+    if not todo["done"]:
+        todo["done"] = True
+        _save_dashboard_data(data)
+    return {"success": True, "message": f"已完成: {todo['text']}", "data": {"todo": todo}}
+
+
+def _do_delete_todo(parts):
+    if len(parts) < 2:
+        return {"success": False, "error": "Missing todo id", "message": "请提供待办ID", "data": None}
+    
+    todo_id = int(parts[1])
+    data = _load_dashboard_data()
+    todos = data["todos"]
+    for i, t in enumerate(todos):
+        if t["id"] == todo_id:
+            del todos[i]
+            _save_dashboard_data(data)
+            break
+    return {"success": True, "message": "已删除待办事项", "data": {"total": len(data["todos"])}}
+
+
+def _do_clear_todos(parts):
+    data = _load_dashboard_data()
+    if data["todos"]:
+        data["todos"] = []
+        _save_dashboard_data(data)
+    return {"success": True, "message": "已清空所有待办事项", "data": {"total": 0}}
+
+
+def _do_update_weather(parts):
+    if len(parts) < 2:
+        return {"success": False, "error": "Missing weather data", "message": "请提供天气数据", "data": None}
+    
+    try:
+        weather_update = json.loads(parts[1])
+        data = _load_dashboard_data()
+        current = data["weather"]["current"]
+        before = dict(current)
+        current.update(weather_update)
+        if current != before:
+            _save_dashboard_data(data)
+        return {"success": True, "message": "天气信息已更新", "data": {"weather": data["weather"]}}
+    except json.JSONDecodeError:
+        return {"success": False, "error": "Invalid JSON", "message": "天气数据格式错误", "data": None}
+
+
+def _do_update_forecast(parts):
+    if len(parts) < 2:
+        return {"success": False, "error": "Missing forecast data", "message": "请提供预报数据", "data": None}
+    
+    try:
+        forecast = json.loads(parts[1])
+        data = _load_dashboard_data()
+        if data["weather"]["forecast"] != forecast:
+            data["weather"]["forecast"] = forecast
+            _save_dashboard_data(data)
+        return {"success": True, "message": "天气预报已更新", "data": {"forecast": forecast}}
+    except json.JSONDecodeError:
+        return {"success": False, "error": "Invalid JSON", "message": "预报数据格式错误", "data": None}
+
+
+def _do_update_worker(parts):
+    if len(parts) < 3:
+        return {"success": False, "error": "Missing worker info", "message": "格式: update_worker||worker_id||status", "data": None}
+    
+    worker_id = parts[1]
+    status = parts[2].lower()
+    
+    worker_status = _WORKER_STATUS_MAP.get(status) or {"status": "idle", "statusText": status}
+    
+    data = _load_dashboard_data()
+    for worker in data["workers"]:
+        if worker["id"] == worker_id:
+            if any(worker.get(k) != v for k, v in worker_status.items()):
+                worker.update(worker_status)
+                _save_dashboard_data(data)
+            return {"success": True, "message": f"Worker {worker_id} 状态已更新为 {worker_status['statusText']}", "data": {"worker": worker}}
+    
+    return {"success": False, "error": "Worker not found", "message": f"找不到 Worker {worker_id}", "data": None}
+
+
+def _do_set_message(parts):
+    if len(parts) < 2:
+        return {"success": False, "error": "Missing message", "message": "请提供消息内容", "data": None}
+    
+    data = _load_dashboard_data()
+    if data.get("system_message") != parts[1]:
+        data["system_message"] = parts[1]
+        _save_dashboard_data(data)
+    return {"success": True, "message": "系统消息已设置", "data": {"message": parts[1]}}
+
+
+def _do_get(parts):
+    # 获取当前 dashboard 数据
+    return {"success": True, "message": "获取 Dashboard 数据成功", "data": _load_dashboard_data()}
+
+
+# action -> handler(parts)；各 handler 校验参数后才读取数据文件
+_ACTIONS = {
+    "add_todo": _do_add_todo,
+    "complete_todo": _do_complete_todo,
+    "delete_todo": _do_delete_todo,
+    "clear_todos": _do_clear_todos,
+    "update_weather": _do_update_weather,
+    "update_forecast": _do_update_forecast,
+    "update_worker": _do_update_worker,
+    "set_message": _do_set_message,
+    "get": _do_get,
+}
+
+_UNKNOWN_ACTION_MESSAGE = "未知操作: {action}。可用操作: " + ", ".join(_ACTIONS)
+
+
 def execute(args: Optional[str] = None) -> Dict[str, Any]:
     """
     更新 Dashboard 信息
@@ -92,124 +373,26 @@ def execute(args: Optional[str] = None) -> Dict[str, Any]:
         parts = [p.strip() for p in args.split("||")]
         action = parts[0].lower()
         
-        data = _load_dashboard_data()
-        
-        # 执行相应操作
-        if action == "add_todo":
-            if len(parts) < 2:
-                return {"success": False, "error": "Missing todo text", "message": "请提供待办事项内容", "data": None}
-            
-            todo = {
-                "id": int(datetime.now().timestamp() * 1000),
-                "text": parts[1],
-                "done": False,
-                "created": datetime.now().isoformat()
-            }
-            data["todos"].append(todo)
-            _save_dashboard_data(data)
-            return {
-                "success": True,
-                "message": f"已添加待办: {parts[1]}",
-                "data": {"todo": todo, "total": len(data["todos"])}
-            }
-        
-        elif action == "complete_todo":
-            if len(parts) < 2:
-                return {"success": False, "error": "Missing todo id", "message": "请提供待办ID", "data": None}
-            
-            todo_id = int(parts[1])
-            for todo in data["todos"]:
-                if todo["id"] == todo_id:
-                    todo["done"] = True
-                    _save_dashboard_data(data)
-                    return {"success": True, "message": f"已完成: {todo['text']}", "data": {"todo": todo}}
-            
-            return {"success": False, "error": "Todo not found", "message": "找不到该待办事项", "data": None}
-        
-        elif action == "delete_todo":
-            if len(parts) < 2:
-                return {"success": False, "error": "Missing todo id", "message": "请提供待办ID", "data": None}
-            
-            todo_id = int(parts[1])
-            data["todos"] = [t for t in data["todos"] if t["id"] != todo_id]
-            _save_dashboard_data(data)
-            return {"success": True, "message": "已删除待办事项", "data": {"total": len(data["todos"])}}
-        
-        elif action == "clear_todos":
-            data["todos"] = []
-            _save_dashboard_data(data)
-            return {"success": True, "message": "已清空所有待办事项", "data": {"total": 0}}
-        
-        elif action == "update_weather":
-            if len(parts) < 2:
-                return {"success": False, "error": "Missing weather data", "message": "请提供天气数据", "data": None}
-            
-            try:
-                weather_update = json.loads(parts[1])
-                data["weather"]["current"].update(weather_update)
-                _save_dashboard_data(data)
-                return {"success": True, "message": "天气信息已更新", "data": {"weather": data["weather"]}}
-            except json.JSONDecodeError:
-                return {"success": False, "error": "Invalid JSON", "message": "天气数据格式错误", "data": None}
-        
-        elif action == "update_forecast":
-            if len(parts) < 2:
-                return {"success": False, "error": "Missing forecast data", "message": "请提供预报数据", "data": None}
-            
-            try:
-                forecast = json.loads(parts[1])
-                data["weather"]["forecast"] = forecast
-                _save_dashboard_data(data)
-                return {"success": True, "message": "天气预报已更新", "data": {"forecast": forecast}}
-            except json.JSONDecodeError:
-                return {"success": False, "error": "Invalid JSON", "message": "预报数据格式错误", "data": None}
-        
-        elif action == "update_worker":
-            if len(parts) < 3:
-                return {"success": False, "error": "Missing worker info", "message": "格式: update_worker||worker_id||status", "data": None}
-            
-            worker_id = parts[1]
-            status = parts[2].lower()
-            
-            status_map = {
-                "working": {"status": "active", "statusText": "工作中"},
-                "active": {"status": "active", "statusText": "工作中"},
-                "busy": {"status": "active", "statusText":"忙碌"},
-                "idle": {"status": "idle", "statusText": "闲置"},
-                "free": {"status": "idle", "statusText": "闲置"},
-                "offline": {"status": "offline", "statusText": "离线"},
-                "down": {"status": "offline", "statusText": "离线"}
-            }
-            
-            worker_status = status_map.get(status, {"status": "idle", "statusText": status})
-            
-            for worker in data["workers"]:
-                if worker["id"] == worker_id:
-                    worker.update(worker_status)
-                    _save_dashboard_data(data)
-                    return {"success": True, "message": f"Worker {worker_id} 状态已更新为 {worker_status['statusText']}", "data": {"worker": worker}}
-            
-            return {"success": False, "error": "Worker not found", "message": f"找不到 Worker {worker_id}", "data": None}
-        
-        elif action == "set_message":
-            if len(parts) < 2:
-                return {"success": False, "error": "Missing message", "message": "请提供消息内容", "data": None}
-            
-            data["system_message"] = parts[1]
-            _save_dashboard_data(data)
-            return {"success": True, "message": "系统消息已设置", "data": {"message": parts[1]}}
-        
-        elif action == "get":
-            # 获取当前 dashboard 数据
-            return {"success": True, "message": "获取 Dashboard 数据成功", "data": data}
-        
-        else:
+        handler = _ACTIONS.get(action)
+        if handler is None:
             return {
                 "success": False,
                 "error": "Unknown action",
-                "message": f"未知操作: {action}。可用操作: add_todo, complete_todo, delete_todo, clear_todos, update_weather, update_forecast, update_worker, set_message, get",
+                "message": _UNKNOWN_ACTION_MESSAGE.format(action=action),
                 "data": None
             }
+
+        result = handler(parts)
+        write_error = _writer.error()
+        if write_error is not None:
+            # 后台写盘一直失败：修改仍在内存中等待重试，但要让调用方知道没有落盘
+            return {
+                **result,
+                "success": False,
+                "error": str(write_error),
+                "message": f"保存 Dashboard 数据失败: {write_error}",
+            }
+        return result
         
     except Exception as e:
         return {
@@ -220,6 +403,15 @@ def execute(args: Optional[str] = None) -> Dict[str, Any]:
         }
 
 
+def unload_skills():
+    """
+    技能重新加载前由 SkillManager 调用：先把未落盘的数据写出，新模块才能读到；
+    同时停掉本模块的写线程和 atexit 钩子，避免每次重载都遗留一份
+    """
+    _writer.close()
+    atexit.unregister(_writer.flush)
+
+
 def register_skills(skill_manager):
     """
     注册此技能
@@ -3,14 +3,28 @@ Task Manager Skill for PiBot Master
 管理 Worker 状态和任务分配
 """
 
+import asyncio
+import concurrent.futures
+import fcntl
 import json
+import math
+import threading
 import time
-import subprocess
 import os
+import re
+import tempfile
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Worker 配置
 WORKERS = {
     "worker_1": {
@@ -30,10 +44,44 @@ WORKERS = {
     },
 }
 
+# Worker HTTP 服务端口（worker_task_executor 默认 5000）
+WORKER_PORT = 5000
+
+# Worker 在线探测结果缓存 {ip: (time.monotonic(), online)}，避免界面刷新时反复探测
+_LIVENESS_TTL = 45.0
+_LIVENESS_CACHE: Dict[str, tuple] = {}
+_LIVENESS_LOCK = threading.Lock()
+
+# 最近分配的任务 ID（毫秒），见 _new_task_id
+_last_task_ms = 0
+_TASK_ID_LOCK = threading.Lock()
+
+# check_task_status 等待完成的最长秒数
+_MAX_WAIT_SECONDS = 120.0
+
+# 写入任务文件的错误信息上限（Worker 返回的错误文本不受控）
+_MAX_ERROR_CHARS = 1024
+
+# 阻塞 I/O（任务文件、分派请求）用的共享线程池；asyncio.run 每次新建的默认
+# 线程池会在调用结束时销毁，复用这个可以省去每次创建线程
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="pibot-task-io"
+)
+
+# 不会再变化的任务状态
+_FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
 # 任务状态存储
 TASKS_DIR = Path("tasks")
 TASKS_DIR.mkdir(exist_ok=True)
 
+# 任务索引：每次状态变化追加一行摘要，列表/统计只需顺序读这一个文件
+TASK_INDEX_FILE = TASKS_DIR / "_index.jsonl"
+# 索引超过此大小时在读取时压缩为每个任务一行
+_INDEX_COMPACT_BYTES = 1 << 20
+# 上次解析的索引：((st_ino, st_size, st_mtime_ns), {task_id: record})
+_index_cache = (None, {})
+
 
 def execute(args: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -42,6 +90,7 @@ def execute(args: Optional[str] = None) -> Dict[str, Any]:
     操作:
     - get_worker_status: 获取 Worker 状态
     - dispatch_task: 分派任务
+    - dispatch_many: 并发分派多个任务
     - check_task_status: 检查任务状态
     - get_all_tasks: 获取所有任务
 
@@ -56,6 +105,7 @@ def execute(args: Optional[str] = None) -> Dict[str, Any]:
                 "available_actions": [
                     "get_worker_status",
                     "dispatch_task",
+                    "dispatch_many",
                     "check_task_status",
                     "get_all_tasks",
                     "cancel_task",
@@ -78,13 +128,39 @@ def execute(args: Optional[str] = None) -> Dict[str, Any]:
                 }
             return dispatch_task(parts[1], parts[2], parts[3] if len(parts) > 3 else "")
 
+        elif action == "dispatch_many":
+            # 参数必须成对出现，否则最后一个 worker_id 会被静默丢弃
+            if len(parts) < 3 or (len(parts) - 1) % 2:
+                return {
+                    "success": False,
+                    "error": "Missing parameters",
+                    "message": "格式: task_manager:dispatch_many||worker_id||task_objective||worker_id||task_objective...",
+                }
+            return dispatch_many(list(zip(parts[1::2], parts[2::2])))
+
         elif action == "check_task_status":
             if len(parts) < 2:
                 return {
                     "success": False,
                     "error": "Missing task_id",
-                    "message": "格式: task_manager:check_task_status||task_id",
+                    "message": "格式: task_manager:check_task_status||task_id[||wait_seconds]",
                 }
+            if len(parts) > 2:
+                try:
+                    max_wait = float(parts[2])
+                except ValueError:
+                    max_wait = math.nan
+                if not math.isfinite(max_wait):
+                    return {
+                        "success": False,
+                        "error": "Invalid wait_seconds",
+                        "message": "格式: task_manager:check_task_status||task_id[||wait_seconds]，wait_seconds 为秒数",
+                    }
+                # 等待会占用一个请求线程，限制在 0..120 秒
+                max_wait = min(max(max_wait, 0.0), _MAX_WAIT_SECONDS)
+                return check_task_status(
+                    parts[1], wait_until_done=True, max_wait=max_wait
+                )
             return check_task_status(parts[1])
 
         elif action == "get_all_tasks":
@@ -103,7 +179,7 @@ def execute(args: Optional[str] = None) -> Dict[str, Any]:
             return {
                 "success": False,
                 "error": f"Unknown action: {action}",
-                "message": "可用操作: get_worker_status, dispatch_task, check_task_status, get_all_tasks, cancel_task",
+                "message": "可用操作: get_worker_status, dispatch_task, dispatch_many, check_task_status, get_all_tasks, cancel_task",
             }
 
     except Exception as e:
@@ -118,17 +194,15 @@ def get_worker_status() -> Dict[str, Any]:
     """
     获取所有 Worker 的状态
 
-    通过 ping 检查 Worker 是否在线，通过任务文件检查是否忙碌
+    并发探测各 Worker 的 HTTP 端口检查是否在线，通过任务文件检查是否忙碌
     """
     statuses = {}
 
-    for worker_id, config in WORKERS.items():
-        # 检查是否在线
-        is_online = _ping_worker(config["ip"])
-
-        # 检查是否有活跃任务
-        active_tasks = _get_worker_active_tasks(worker_id)
-        is_busy = len(active_tasks) > 0
+    for worker_id, (is_online, active_tasks) in asyncio.run(
+        _collect_worker_state()
+    ).items():
+        config = WORKERS[worker_id]
+        is_busy = bool(active_tasks)
 
         if not is_online:
             status = "offline"
@@ -153,9 +227,10 @@ def get_worker_status() -> Dict[str, Any]:
         }
 
     # 统计
-    idle_count = sum(1 for s in statuses.values() if s["status"] == "idle")
-    busy_count = sum(1 for s in statuses.values() if s["status"] == "busy")
-    offline_count = sum(1 for s in statuses.values() if s["status"] == "offline")
+    counts = Counter(s["status"] for s in statuses.values())
+    idle_count = counts["idle"]
+    busy_count = counts["busy"]
+    offline_count = counts["offline"]
 
     return {
         "success": True,
@@ -191,22 +266,19 @@ def dispatch_task(worker_id: str, objective: str, context: str = "") -> Dict[str
             "message": f"可用 Worker: {', '.join(WORKERS.keys())}",
         }
 
-    # 检查 Worker 是否在线
+    # 不再预先 ping：下面的 HTTP 请求连不上即说明 Worker 离线
     config = WORKERS[worker_id]
-    if not _ping_worker(config["ip"]):
-        return {
-            "success": False,
-            "error": f"Worker {worker_id} is offline",
-            "message": f"Worker {config['name']} ({config['ip']}) 当前离线，无法分派任务",
-        }
+    offline = False
 
     # 生成任务 ID
-    task_id = f"task_{int(time.time() * 1000)}"
+    task_id = _new_task_id()
 
     # 创建任务定义
+    now = time.time()
     task = {
         "task_id": task_id,
-        "created_at": datetime.now().isoformat(),
+        "created_at": datetime.fromtimestamp(now).isoformat(),
+        "created_at_epoch": now,
         "worker_id": worker_id,
         "objective": objective,
         "context": context,
@@ -218,15 +290,13 @@ def dispatch_task(worker_id: str, objective: str, context: str = "") -> Dict[str
         "max_retries": 2,
     }
 
-    # 保存任务文件
+    # 任务文件只在分派结果确定后写一次
     task_file = TASKS_DIR / f"{task_id}.json"
-    with open(task_file, "w", encoding="utf-8") as f:
-        json.dump(task, f, ensure_ascii=False, indent=2)
 
     # 尝试分发到 Worker (使用 HTTP POST)
     try:
         worker_ip = config["ip"]
-        worker_url = f"http://{worker_ip}:5000/task"
+        worker_url = f"http://{worker_ip}:{WORKER_PORT}/task"
 
         # 准备 HTTP POST 请求数据
         payload = {
@@ -241,35 +311,46 @@ def dispatch_task(worker_id: str, objective: str, context: str = "") -> Dict[str
 
         req = urllib.request.Request(
             worker_url,
-            data=json.dumps(payload).encode("utf-8"),
+            data=_dumps(payload),
             headers={"Content-Type": "application/json"},
             method="POST",
         )
 
         try:
             with urllib.request.urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode("utf-8"))
+                _set_liveness(worker_ip, True)
+                result = _loads(response.read())
                 if result.get("success"):
                     task["status"] = "dispatched"
                     task["dispatched_at"] = datetime.now().isoformat()
-                    with open(task_file, "w", encoding="utf-8") as f:
-                        json.dump(task, f, ensure_ascii=False, indent=2)
                 else:
                     raise Exception(result.get("error", "Unknown error"))
-        except urllib.error.URLError as e:
+        except urllib.error.HTTPError as e:
+            _set_liveness(worker_ip, True)
             raise Exception(f"HTTP error: {e}")
+        except urllib.error.URLError as e:
+            _set_liveness(worker_ip, False)
+            offline = True
+            raise Exception(f"Worker {worker_id} is offline: {e.reason}")
 
     except Exception as e:
+        if not offline:
+            # 超时等未知故障：丢弃缓存的“在线”结果，下次重新探测
+            _invalidate_liveness(config["ip"])
         task["status"] = "failed"
-        task["error"] = str(e)
-        with open(task_file, "w", encoding="utf-8") as f:
-            json.dump(task, f, ensure_ascii=False, indent=2)
+        task["error"] = str(e)[:_MAX_ERROR_CHARS]
+        _save_task(task_file, task)
         return {
             "success": False,
             "error": str(e),
-            "message": f"任务分派失败: {str(e)}",
+            "message": (
+                f"Worker {config['name']} ({config['ip']}) 当前离线，无法分派任务"
+                if offline
+                else f"任务分派失败: {str(e)}"
+            ),
         }
 
+    _save_task(task_file, task)
     return {
         "success": True,
         "message": f"任务已分派给 {config['name']}",
@@ -285,10 +366,59 @@ def dispatch_task(worker_id: str, objective: str, context: str = "") -> Dict[str
     }
 
 
-def check_task_status(task_id: str) -> Dict[str, Any]:
+async def dispatch_task_async(
+    worker_id: str, objective: str, context: str = ""
+) -> Dict[str, Any]:
+    """dispatch_task 的协程版本（阻塞的 HTTP 请求在线程中执行）"""
+    return await _run_blocking(dispatch_task, worker_id, objective, context)
+
+
+def dispatch_many(specs: List[tuple]) -> Dict[str, Any]:
+    """
+    并发分派多个任务，总耗时约为最慢的一次分派
+
+    Args:
+        specs: [(worker_id, objective) 或 (worker_id, objective, context), ...]
+    """
+
+    async def _dispatch_all():
+        return await asyncio.gather(*(dispatch_task_async(*spec) for spec in specs))
+
+    results = asyncio.run(_dispatch_all())
+    ok_count = sum(1 for r in results if r.get("success"))
+
+    return {
+        "success": ok_count == len(results),
+        "message": f"已分派 {ok_count}/{len(results)} 个任务",
+        "data": {"results": results},
+    }
+
+
+def check_task_status(
+    task_id: str, wait_until_done: bool = False, max_wait: float = 60.0
+) -> Dict[str, Any]:
     """
     检查任务执行状态 (从 Worker 的 outbox 拉取结果)
+
+    wait_until_done=True 时在 max_wait 秒内反复检查，直到任务结束；
+    检查间隔从 0.1s 按 1.5 倍递增到 5s，刚结束的短任务能很快拿到结果。
     """
+    if not wait_until_done:
+        return _check_task_status_once(task_id)
+
+    deadline = time.monotonic() + max_wait
+    interval = 0.1
+    while True:
+        result = _check_task_status_once(task_id)
+        status = (result.get("data") or {}).get("status")
+        remaining = deadline - time.monotonic()
+        if not result["success"] or status in _FINISHED_STATUSES or remaining <= 0:
+            return result
+        time.sleep(min(interval, remaining))
+        interval = min(5.0, interval * 1.5)
+
+
+def _check_task_status_once(task_id: str) -> Dict[str, Any]:
     task_file = TASKS_DIR / f"{task_id}.json"
     local_result_file = Path("outbox") / f"result_{task_id}.json"
 
@@ -300,8 +430,7 @@ def check_task_status(task_id: str) -> Dict[str, Any]:
         }
 
     # 加载任务定义
-    with open(task_file, "r", encoding="utf-8") as f:
-        task = json.load(f)
+    task = _loads(task_file.read_bytes())
 
     worker_id = task.get("worker_id")
 
@@ -312,29 +441,26 @@ def check_task_status(task_id: str) -> Dict[str, Any]:
             try:
                 import urllib.request
 
-                worker_url = f"http://{worker_ip}:5000/task/{task_id}/result"
+                worker_url = f"http://{worker_ip}:{WORKER_PORT}/task/{task_id}/result"
                 req = urllib.request.Request(worker_url, method="GET")
                 with urllib.request.urlopen(req, timeout=10) as response:
-                    result_data = json.loads(response.read().decode("utf-8"))
+                    result_data = _loads(response.read())
                     if result_data.get("status") in ["completed", "failed"]:
                         # Worker 已完成，保存到本地
-                        with open(local_result_file, "w", encoding="utf-8") as f:
-                            json.dump(result_data, f, ensure_ascii=False, indent=2)
+                        local_result_file.write_bytes(_dumps(result_data))
                         # 更新任务状态
                         task["status"] = result_data.get("status", "completed")
                         if result_data.get("completed_at"):
                             task["completed_at"] = result_data["completed_at"]
                         else:
                             task["completed_at"] = datetime.now().isoformat()
-                        with open(task_file, "w", encoding="utf-8") as f:
-                            json.dump(task, f, ensure_ascii=False, indent=2)
+                        _save_task(task_file, task)
             except Exception:
                 pass  # HTTP 请求失败，继续检查本地结果
 
     # 检查是否有本地结果文件
     if local_result_file.exists():
-        with open(local_result_file, "r", encoding="utf-8") as f:
-            result = json.load(f)
+        result = _loads(local_result_file.read_bytes())
 
         return {
             "success": True,
@@ -351,10 +477,14 @@ def check_task_status(task_id: str) -> Dict[str, Any]:
         }
 
     # 任务仍在执行中
-    created_at = datetime.fromisoformat(
-        task.get("created_at", datetime.now().isoformat())
-    )
-    elapsed = (datetime.now() - created_at).total_seconds()
+    if "created_at_epoch" in task:
+        elapsed = time.time() - task["created_at_epoch"]
+    else:
+        # 旧任务文件没有 created_at_epoch
+        created_at = datetime.fromisoformat(
+            task.get("created_at", datetime.now().isoformat())
+        )
+        elapsed = (datetime.now() - created_at).total_seconds()
 
     return {
         "success": True,
@@ -374,28 +504,19 @@ def get_all_tasks() -> Dict[str, Any]:
     """
     获取所有任务列表
     """
-    tasks = []
-
-    for task_file in TASKS_DIR.glob("task_*.json"):
-        try:
-            with open(task_file, "r", encoding="utf-8") as f:
-                task = json.load(f)
-
-            # 简化信息
-            tasks.append(
-                {
-                    "task_id": task.get("task_id"),
-                    "status": task.get("status"),
-                    "worker_id": task.get("worker_id"),
-                    "objective": task.get("objective", "")[:50] + "...",
-                    "created_at": task.get("created_at"),
-                }
-            )
-        except:
-            continue
+    tasks = [
+        {
+            "task_id": rec.get("task_id"),
+            "status": rec.get("status"),
+            "worker_id": rec.get("worker_id"),
+            "objective": rec.get("objective", "") + "...",
+            "created_at": rec.get("created_at"),
+        }
+        for rec in _read_task_index().values()
+    ]
 
     # 按创建时间排序
-    tasks.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+    tasks.sort(key=lambda x: x.get("created_at") or "", reverse=True)
 
     return {
         "success": True,
@@ -421,8 +542,7 @@ def cancel_task(task_id: str) -> Dict[str, Any]:
         }
 
     # 加载并更新状态
-    with open(task_file, "r", encoding="utf-8") as f:
-        task = json.load(f)
+    task = _loads(task_file.read_bytes())
 
     if task.get("status") in ["completed", "failed"]:
         return {
@@ -434,8 +554,7 @@ def cancel_task(task_id: str) -> Dict[str, Any]:
     task["status"] = "cancelled"
     task["cancelled_at"] = datetime.now().isoformat()
 
-    with open(task_file, "w", encoding="utf-8") as f:
-        json.dump(task, f, ensure_ascii=False, indent=2)
+    _save_task(task_file, task)
 
     return {
         "success": True,
@@ -447,72 +566,233 @@ def cancel_task(task_id: str) -> Dict[str, Any]:
 # 辅助函数
 
 
-def _ping_worker(ip: str) -> bool:
-    """Ping Worker 检查是否在线"""
+def _new_task_id() -> str:
+    """毫秒时间戳任务 ID；并发分派时保证不重复"""
+    global _last_task_ms
+    with _TASK_ID_LOCK:
+        _last_task_ms = max(time.time_ns() // 1_000_000, _last_task_ms + 1)
+        return f"task_{_last_task_ms}"
+
+
+async def _probe_tcp(ip: str, port: int = WORKER_PORT, timeout: float = 1.0) -> bool:
+    """连接 Worker 的 HTTP 端口检查是否在线（比 ping 更能说明服务可用）"""
     try:
-        result = subprocess.run(
-            ["ping", "-c", "1", "-W", "2", ip], capture_output=True, timeout=5
-        )
-        return result.returncode == 0
-    except:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+    except (OSError, asyncio.TimeoutError):
         return False
+    writer.close()
+    return True
+
+
+async def _probe_worker(ip: str) -> bool:
+    """带 TTL 缓存的在线探测"""
+    with _LIVENESS_LOCK:
+        cached = _LIVENESS_CACHE.get(ip)
+    if cached and time.monotonic() - cached[0] < _LIVENESS_TTL:
+        return cached[1]
+    online = await _probe_tcp(ip)
+    _set_liveness(ip, online)
+    return online
+
+
+def _set_liveness(ip: str, online: bool) -> None:
+    with _LIVENESS_LOCK:
+        _LIVENESS_CACHE[ip] = (time.monotonic(), online)
+
+
+def _invalidate_liveness(ip: str) -> None:
+    with _LIVENESS_LOCK:
+        _LIVENESS_CACHE.pop(ip, None)
+
+
+async def _collect_worker_state() -> Dict[str, tuple]:
+    """并发探测所有 Worker 并扫描活跃任务，返回 {worker_id: (online, active_tasks)}"""
+    worker_ids = list(WORKERS)
+    probes = asyncio.gather(*(_probe_worker(WORKERS[w]["ip"]) for w in worker_ids))
+    # 索引只读一次，与探测并行
+    online, index = await asyncio.gather(probes, _run_blocking(_read_task_index))
+    return {
+        w: (is_online, _active_tasks_in(index, w))
+        for w, is_online in zip(worker_ids, online)
+    }
 
 
 def _get_worker_active_tasks(worker_id: str) -> List[str]:
     """获取 Worker 的活跃任务"""
-    active_tasks = []
+    return _active_tasks_in(_read_task_index(), worker_id)
+
+
+def _active_tasks_in(index: Dict[str, Dict[str, Any]], worker_id: str) -> List[str]:
+    return [
+        rec["task_id"]
+        for rec in index.values()
+        if rec.get("worker_id") == worker_id
+        and rec.get("status") in ["pending", "running"]
+    ]
+
+
+async def _run_blocking(func, *args):
+    """在共享线程池中运行阻塞调用（文件/HTTP），不阻塞事件循环"""
+    return await asyncio.get_running_loop().run_in_executor(_IO_POOL, func, *args)
+
+
+def _dumps(obj: Any) -> bytes:
+    """紧凑 UTF-8 JSON（有 orjson 时用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
+def _save_task(task_file: Path, task: Dict[str, Any]) -> None:
+    """原子写入任务文件（临时文件 + os.replace），并把状态摘要追加到任务索引"""
+    tmp = task_file.with_suffix(".json.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_dumps(task))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, task_file)
+    _append_task_index([task])
+
+
+def _index_line(task: Dict[str, Any]) -> bytes:
+    record = {
+        "task_id": task.get("task_id"),
+        "status": task.get("status"),
+        "worker_id": task.get("worker_id"),
+        "objective": (task.get("objective") or "")[:50],
+        "created_at": task.get("created_at"),
+    }
+    return _dumps(record) + b"\n"
+
+
+def _append_task_index(tasks: List[Dict[str, Any]]) -> None:
+    lines = b"".join(_index_line(task) for task in tasks)
+    if not TASK_INDEX_FILE.exists():
+        _rebuild_task_index()
+    with open(TASK_INDEX_FILE, "ab") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(lines)
+
+
+def _read_task_index() -> Dict[str, Dict[str, Any]]:
+    """
+    读取任务索引，每个 task_id 只保留最后一条记录；文件过大时原地压缩
+
+    索引未变化（inode/大小/mtime 相同）时直接返回上次解析的结果，调用方不得修改。
+    """
+    global _index_cache
+    try:
+        f = open(TASK_INDEX_FILE, "r+b")
+    except FileNotFoundError:
+        _rebuild_task_index()
+        f = open(TASK_INDEX_FILE, "r+b")
+    with f:
+        compact = os.fstat(f.fileno()).st_size > _INDEX_COMPACT_BYTES
+        fcntl.flock(f, fcntl.LOCK_EX if compact else fcntl.LOCK_SH)
+        st = os.fstat(f.fileno())
+        signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+        cached_signature, cached = _index_cache
+        if signature == cached_signature and not compact:
+            return cached
+
+        latest = {}
+        for line in f:
+            try:
+                record = _loads(line)
+            except ValueError:
+                continue  # 写了一半的行
+            latest[record.get("task_id")] = record
+        if compact:
+            f.seek(0)
+            f.write(b"".join(_index_line(record) for record in latest.values()))
+            f.truncate()
+            f.flush()
+            st = os.fstat(f.fileno())
+            signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+        _index_cache = (signature, latest)
+    return latest
+
+
+def _rebuild_task_index() -> None:
+    """
+    从现有任务文件生成索引（升级前创建的任务），在首次读写索引时调用
+
+    先写临时文件再用 os.link 原子地放到位：其他进程已经生成的索引不会被覆盖，
+    也不会有人读到写了一半的索引。
+    """
+    tasks = []
     for task_file in TASKS_DIR.glob("task_*.json"):
         try:
-            with open(task_file, "r", encoding="utf-8") as f:
-                task = json.load(f)
-
-            if task.get("worker_id") == worker_id and task.get("status") in [
-                "pending",
-                "running",
-            ]:
-                active_tasks.append(task.get("task_id"))
-        except:
+            tasks.append(_loads(task_file.read_bytes()))
+        except (OSError, ValueError):
             continue
-
-    return active_tasks
+    fd, tmp = tempfile.mkstemp(dir=TASKS_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"".join(_index_line(task) for task in tasks))
+        os.link(tmp, TASK_INDEX_FILE)
+    except FileExistsError:
+        pass  # 其他进程/线程先生成了
+    finally:
+        os.unlink(tmp)
+
+
+# 任务类型关键词，按优先级排列（先命中的类型优先）
+_TASK_TYPE_KEYWORDS = [
+    ("web_fetch", ["下载", "fetch", "http", "url", "网页"]),
+    ("file_op", ["文件", "移动", "复制", "删除", "file", "move", "copy", "delete"]),
+    ("shell", ["执行", "运行", "shell", "command", "cmd", "exec"]),
+    ("skill", ["skill", "技能"]),
+]
+
+# 所有关键词合成一个分支表达式，每个类型一个命名分组，全文只扫描一遍
+_TASK_TYPE_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, keywords))})"
+        for name, keywords in _TASK_TYPE_KEYWORDS
+    ),
+    re.IGNORECASE,
+)
+_TASK_TYPE_PRIORITY = {name: i for i, (name, _) in enumerate(_TASK_TYPE_KEYWORDS)}
+
+
+# 任务类型 -> 所需技能（只读）
+_DEFAULT_SKILLS = ("read_file", "write_file")
+_SKILL_MAP = MappingProxyType(
+    {
+        "web_fetch": ("web_fetch", "file_write"),
+        "file_op": ("read_file", "write_file", "run_cmd"),
+        "shell": ("run_cmd",),
+        "skill": ("skill_manager",),
+        "generic": _DEFAULT_SKILLS,
+    }
+)
 
 
+@lru_cache(maxsize=1024)
 def _determine_task_type(objective: str) -> str:
     """根据目标确定任务类型"""
-    objective_lower = objective.lower()
-
-    if any(kw in objective_lower for kw in ["下载", "fetch", "http", "url", "网页"]):
-        return "web_fetch"
-    elif any(
-        kw in objective_lower
-        for kw in ["文件", "移动", "复制", "删除", "file", "move", "copy", "delete"]
-    ):
-        return "file_op"
-    elif any(
-        kw in objective_lower
-        for kw in ["执行", "运行", "shell", "command", "cmd", "exec"]
-    ):
-        return "shell"
-    elif any(kw in objective_lower for kw in ["skill", "技能"]):
-        return "skill"
-    else:
-        return "generic"
+    best = None
+    for m in _TASK_TYPE_RE.finditer(objective):
+        if best is None or _TASK_TYPE_PRIORITY[m.lastgroup] < _TASK_TYPE_PRIORITY[best]:
+            best = m.lastgroup
+            if _TASK_TYPE_PRIORITY[best] == 0:
+                break  # 已是最高优先级
+    return best or "generic"
 
 
 def _determine_required_skills(objective: str) -> List[str]:
     """确定任务需要的技能"""
-    task_type = _determine_task_type(objective)
-
-    skill_map = {
-        "web_fetch": ["web_fetch", "file_write"],
-        "file_op": ["read_file", "write_file", "run_cmd"],
-        "shell": ["run_cmd"],
-        "skill": ["skill_manager"],
-        "generic": ["read_file", "write_file"],
-    }
+    return list(_SKILL_MAP.get(_determine_task_type(objective), _DEFAULT_SKILLS))
+
 
-    return skill_map.get(task_type, ["read_file", "write_file"])
+def unload_skills():
+    """技能重新加载前由 SkillManager 调用：释放本模块的线程池，避免每次重载遗留一份"""
+    _IO_POOL.shutdown(wait=False)
 
 
 def register_skills(skill_manager):
@@ -523,6 +803,6 @@ def register_skills(skill_manager):
     """
     skill_manager.register(
         "task_manager",
-        "任务管理器：查看 Worker 状态、分派任务、检查任务进度。关键用法: task_manager:dispatch_task||worker_id||task_description - 必须实际调用此skill来分发任务，不能只说任务已分配",
+        "任务管理器：查看 Worker 状态、分派任务、检查任务进度。关键用法: task_manager:dispatch_task||worker_id||task_description - 必须实际调用此skill来分发任务，不能只说任务已分配。多个任务可用 task_manager:dispatch_many||worker_id||task_description||worker_id||task_description 并发分派",
         execute,
     )
@@ -11,10 +11,76 @@ Behavior:
 - Do not return raw content to user; always provide a helpful summary
 """
 
-import requests
 import re
 import logging
 import json
+from email.message import Message
+
+# Parse HTML in C when a parser is installed; the regex scrubber is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# Elements whose content is never readable page text
+_SKIP_TAGS = ("script", "style", "noscript", "iframe", "svg", "canvas")
+
+# HTML cleaning patterns (regex fallback), compiled once at import
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_NOSCRIPT_RE = re.compile(r'<noscript[^>]*>.*?</noscript>', re.DOTALL | re.IGNORECASE)
+_IFRAME_RE = re.compile(r'<iframe[^>]*>.*?</iframe>', re.DOTALL | re.IGNORECASE)
+_SVG_RE = re.compile(r'<svg[^>]*>.*?</svg>', re.DOTALL | re.IGNORECASE)
+_CANVAS_RE = re.compile(r'<canvas[^>]*>.*?</canvas>', re.DOTALL | re.IGNORECASE)
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_DESC_RE1 = re.compile(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', re.IGNORECASE)
+_DESC_RE2 = re.compile(r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Shared session: repeated fetches reuse pooled (TLS) connections, headers set once.
+# requests is imported on first fetch: it is slow to import on a Pi and skill
+# loading should not pay for it.
+_HTTP = None
+
+
+def _http_session():
+    """Return the shared requests session, creating it on first use."""
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": "gzip, deflate",
+            "DNT": "1",
+            "Connection": "keep-alive",
+        })
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _HTTP = session
+    return _HTTP
+
+
+# url -> (conditional request headers, processed result) from the last 200 response
+_FETCH_CACHE = {}
+_FETCH_CACHE_SIZE = 64
+
+MAX_BYTES = 512 * 1024  # Cap on bytes read from a page; only the first 3000 chars are returned
 
 
 def execute(args=None):
@@ -38,6 +104,8 @@ def execute(args=None):
             - content: Extracted text content (first ~2000 chars)
             - content_length: Total content size
     """
+    import requests  # for the except clauses below; a dict lookup after the first fetch
+
     try:
         if not args:
             return {"error": "Please provide a URL"}
@@ -48,47 +116,52 @@ def execute(args=None):
         if not url.startswith(("http://", "https://")):
             return {"error": f"Invalid URL: {url}"}
 
-        # Fetch webpage
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "DNT": "1",
-            "Connection": "keep-alive",
-        }
-
-        response = requests.get(
+        # Fetch webpage (conditional GET if we have validators for this URL)
+        cached = _FETCH_CACHE.get(url)
+        response = _http_session().get(
             url, 
-            headers=headers, 
+            headers=cached[0] if cached else None,
             timeout=30,
             allow_redirects=True,
-            verify=True
+            verify=True,
+            stream=True
         )
-        response.raise_for_status()
-        
-        # Ensure proper encoding
-        if response.encoding is None:
-            response.encoding = 'utf-8'
+        with response:
+            if response.status_code == 304 and cached:
+                # Unchanged since the last fetch: reuse the processed result
+                return dict(cached[1])
+            response.raise_for_status()
+            # Read at most MAX_BYTES; urllib3 undoes gzip/deflate as it reads
+            body = response.raw.read(MAX_BYTES, decode_content=True)
+
+        # Decode with the charset the server declared, else UTF-8 (requests
+        # would otherwise assume ISO-8859-1 for text/* without a charset)
+        try:
+            text = body.decode(_declared_charset(response.headers), 'replace')
+        except LookupError:
+            text = body.decode('utf-8', 'replace')
 
         # Extract content
         content_type = response.headers.get("content-type", "").lower()
 
         if "text/html" in content_type:
-            return _process_html(response.text, url)
+            result = _process_html(text, url)
         elif "application/json" in content_type:
-            return _process_json(response.text, url)
+            result = _process_json(text, url)
         else:
             # Other content type
-            return {
+            result = {
                 "url": url,
                 "title": "Unknown",
                 "description": None,
-                "content": response.text[:2000],
-                "content_length": len(response.text),
+                "content": text[:2000],
+                "content_length": len(text),
                 "content_type": content_type
             }
 
+        _remember(url, response.headers, result)
+        return result
+
     except requests.exceptions.Timeout:
         return {"error": "Request timeout (>30s). The server may be slow or unreachable."}
     except requests.exceptions.SSLError as e:
@@ -102,46 +175,113 @@ def execute(args=None):
         return {"error": str(e)}
 
 
+def _declared_charset(headers):
+    """Charset from the Content-Type header, defaulting to UTF-8"""
+    msg = Message()
+    msg["Content-Type"] = headers.get("content-type", "")
+    return msg.get_content_charset("utf-8")
+
+
+def _remember(url, headers, result):
+    """Keep the result with the response's validators for a later conditional GET."""
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    if not validators:
+        _FETCH_CACHE.pop(url, None)
+        return
+    _FETCH_CACHE.pop(url, None)  # re-insert as most recent
+    _FETCH_CACHE[url] = (validators, dict(result))
+    while len(_FETCH_CACHE) > _FETCH_CACHE_SIZE:
+        _FETCH_CACHE.pop(next(iter(_FETCH_CACHE)), None)
+
+
 def _process_html(html, url):
     """Process HTML content and extract readable text."""
+    if HTMLParser is not None:
+        title, meta_desc, text = _parse_html_selectolax(html)
+    elif lxml is not None:
+        try:
+            title, meta_desc, text = _parse_html_lxml(html)
+        except (ValueError, lxml.etree.LxmlError):
+            # empty document, or an XML encoding declaration in a str
+            title, meta_desc, text = _parse_html_regex(html)
+    else:
+        title, meta_desc, text = _parse_html_regex(html)
+
+    title = _WS_RE.sub(' ', title).strip() or "No title"
+    if meta_desc:
+        meta_desc = meta_desc.strip() or None
+    text = _WS_RE.sub(' ', text).strip()
+    
+    # Return structured data
+    return {
+        "url": url,
+        "title": title,
+        "description": meta_desc,
+        "content": text[:3000],  # First 3000 chars
+        "content_length": len(text)
+    }
+
+
+def _parse_html_selectolax(html):
+    """Return (title, description, text) from a single lexbor parse."""
+    tree = HTMLParser(html)
+    for tag in _SKIP_TAGS:
+        for node in tree.css(tag):
+            node.decompose()
+    node = tree.css_first("title")
+    title = node.text() if node else ""
+    node = tree.css_first('meta[name="description"]')
+    meta_desc = node.attributes.get("content") if node else None
+    root = tree.body or tree.root
+    text = root.text(separator=" ") if root else ""
+    return title, meta_desc, text
+
+
+def _parse_html_lxml(html):
+    """Return (title, description, text) from a single lxml parse."""
+    doc = lxml.html.fromstring(html)
+    for el in list(doc.iter(*_SKIP_TAGS)):
+        el.drop_tree()
+    title = doc.findtext(".//title") or ""
+    desc = doc.xpath('//meta[@name="description"]/@content')
+    meta_desc = desc[0] if desc else None
+    body = doc.find(".//body")
+    text = (body if body is not None else doc).text_content()
+    return title, meta_desc, text
+
+
+def _parse_html_regex(html):
+    """Return (title, description, text) by regex-stripping the markup."""
     # Remove script tags and their content
-    html = re.sub(r'<script[^>]*>.*?</script>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _SCRIPT_RE.sub(' ', html)
     # Remove style tags and their content  
-    html = re.sub(r'<style[^>]*>.*?</style>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _STYLE_RE.sub(' ', html)
     # Remove noscript tags
-    html = re.sub(r'<noscript[^>]*>.*?</noscript>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _NOSCRIPT_RE.sub(' ', html)
     # Remove iframe tags
-    html = re.sub(r'<iframe[^>]*>.*?</iframe>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _IFRAME_RE.sub(' ', html)
     # Remove SVG content
-    html = re.sub(r'<svg[^>]*>.*?</svg>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _SVG_RE.sub(' ', html)
     # Remove canvas tags
-    html = re.sub(r'<canvas[^>]*>.*?</canvas>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _CANVAS_RE.sub(' ', html)
     
     # Extract title
-    title_match = re.search(r'<title[^>]*>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
-    title = title_match.group(1).strip() if title_match else "No title"
-    title = re.sub(r'\s+', ' ', title).strip()
+    title_match = _TITLE_RE.search(html)
+    title = title_match.group(1) if title_match else ""
     
     # Extract meta description
-    desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', html, re.IGNORECASE)
+    desc_match = _DESC_RE1.search(html)
     if not desc_match:
-        desc_match = re.search(r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']', html, re.IGNORECASE)
-    meta_desc = desc_match.group(1).strip() if desc_match else None
+        desc_match = _DESC_RE2.search(html)
+    meta_desc = desc_match.group(1) if desc_match else None
     
     # Remove all remaining HTML tags
-    text = re.sub(r'<[^>]+>', ' ', html)
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Return structured data
-    return {
-        "url": url,
-        "title": title,
-        "description": meta_desc,
-        "content": text[:3000],  # First 3000 chars
-        "content_length": len(text)
-    }
+    text = _TAG_RE.sub(' ', html)
+    return title, meta_desc, text
 
 
 def _process_json(text, url):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import importlib.util
 import py_compile
 import sys
 from pathlib import Path
@@ -105,3 +106,76 @@ def test_worker_route_has_busy_reject_guard() -> None:
     assert "409" in receive_task_block, (
         "receive_task should return HTTP 409 when worker is busy"
     )
+
+
+def test_skill_manager_skips_shadowed_core_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # skills import with side effects in the cwd (memory files, tasks/)
+    monkeypatch.chdir(tmp_path)
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from skill_manager import SHADOWED_MODULES, SkillManager
+
+    manager = SkillManager(str(REPO_ROOT / "skills"))
+    manager.load_skills()
+
+    assert "create_skill" in manager.skills
+    modules = {func.__module__.rsplit(".", 1)[-1] for func in manager.skills.values()}
+    assert not modules & (SHADOWED_MODULES - {"core"}), modules
+    assert manager.skills["create_skill"].__module__ == "core_enhanced_v2"
+
+
+def test_memory_manager_loads_existing_tape_at_import(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # master_hub builds its MemoryManager at import time from ./memory.jsonl,
+    # so load a fresh copy of the module over a tape that already has entries
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "memory.jsonl").write_text(
+        "".join(
+            f'{{"id": {1000 + i}, "role": "user", "content": "m{i}"}}\n'
+            for i in range(5)
+        ),
+        encoding="utf-8",
+    )
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    spec = importlib.util.spec_from_file_location(
+        "master_hub_fresh", REPO_ROOT / "master_hub.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    memory = module.memory
+
+    assert [e["content"] for e in memory.read(5)] == [f"m{i}" for i in range(5)]
+    assert memory._last_id == 1004
+    assert memory.append("assistant", "reply")["id"] > 1004
+
+
+def test_task_manager_dispatch_many_rejects_unpaired_arguments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)  # task_manager creates tasks/ in cwd
+    spec = importlib.util.spec_from_file_location(
+        "task_manager_under_test", REPO_ROOT / "skills" / "task_manager.py"
+    )
+    task_manager = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(task_manager)
+    dispatched = []
+    monkeypatch.setattr(task_manager, "dispatch_many", dispatched.append)
+
+    for args in (
+        "dispatch_many",
+        "dispatch_many||worker_1",
+        "dispatch_many||worker_1||fetch a page||worker_2",
+    ):
+        result = task_manager.execute(args)
+        assert result["success"] is False, args
+        assert result["error"] == "Missing parameters", args
+    assert dispatched == []
+
+    task_manager.execute("dispatch_many||worker_1||a||worker_2||b")
+    assert dispatched == [[("worker_1", "a"), ("worker_2", "b")]]